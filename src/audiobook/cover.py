@@ -5,7 +5,7 @@ from pathlib import Path
 
 from lxml import etree
 
-from epub_io.path_utils import normalize_epub_href
+from epub_io.path_utils import href_normalizer
 from epub_io.reader import EpubReader
 from epub_io.resources import get_item_by_href
 
@@ -30,6 +30,7 @@ def find_spine_cover_candidate(reader: EpubReader) -> SpineCoverCandidate | None
         tree = document.tree
         if tree is None:
             continue
+        normalize_href = href_normalizer(document.path)
         for element in tree.iter():
             try:
                 tag_name = etree.QName(element.tag).localname
@@ -42,7 +43,7 @@ def find_spine_cover_candidate(reader: EpubReader) -> SpineCoverCandidate | None
                 href_value = element.get(attr)
                 if href_value:
                     break
-            candidate_href_str = normalize_epub_href(document.path, href_value or "")
+            candidate_href_str = normalize_href(href_value or "")
             if not candidate_href_str:
                 continue
             try:
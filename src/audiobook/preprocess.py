@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import html
 import re
+from functools import lru_cache
 
 from lxml import html as lxml_html
 
@@ -11,39 +12,47 @@ BLOCK_PUNCTUATION = re.compile(r"[.!?…]$")
 NON_WORD_RE = re.compile(r"^[^\w]+$")
 LIST_TAGS = {"ul", "ol"}
 
-# Roman numeral pattern and conversion
+# Roman numeral pattern and conversion. ASCII-only case folding: with Unicode
+# IGNORECASE, [IVXLCDM] also matched the dotless "ı", which .upper() then turned
+# into a real "I", so Turkish text like "ıı" was read out as "Two".
 ROMAN_NUMERAL_PATTERN = re.compile(
     r'^(?:(Chapter|Part|Book|Section)\s+)?([IVXLCDM]+)([.:\-—]?)$',
-    re.IGNORECASE
+    re.IGNORECASE | re.ASCII
 )
 
-ROMAN_TO_INT = {
-    'I': 1, 'II': 2, 'III': 3, 'IV': 4, 'V': 5,
-    'VI': 6, 'VII': 7, 'VIII': 8, 'IX': 9, 'X': 10,
-    'XI': 11, 'XII': 12, 'XIII': 13, 'XIV': 14, 'XV': 15,
-    'XVI': 16, 'XVII': 17, 'XVIII': 18, 'XIX': 19, 'XX': 20,
-    'XXI': 21, 'XXII': 22, 'XXIII': 23, 'XXIV': 24, 'XXV': 25,
-    'XXVI': 26, 'XXVII': 27, 'XXVIII': 28, 'XXIX': 29, 'XXX': 30,
-    'XXXI': 31, 'XXXII': 32, 'XXXIII': 33, 'XXXIV': 34, 'XXXV': 35,
-    'XXXVI': 36, 'XXXVII': 37, 'XXXVIII': 38, 'XXXIX': 39, 'XL': 40,
-    'XLI': 41, 'XLII': 42, 'XLIII': 43, 'XLIV': 44, 'XLV': 45,
-    'XLVI': 46, 'XLVII': 47, 'XLVIII': 48, 'XLIX': 49, 'L': 50,
-    'LX': 60, 'LXX': 70, 'LXXX': 80, 'XC': 90, 'C': 100,
-}
+_ONES = (
+    "", "One", "Two", "Three", "Four", "Five", "Six", "Seven", "Eight", "Nine", "Ten",
+    "Eleven", "Twelve", "Thirteen", "Fourteen", "Fifteen", "Sixteen", "Seventeen",
+    "Eighteen", "Nineteen",
+)
+_TENS = ("", "", "Twenty", "Thirty", "Forty", "Fifty", "Sixty", "Seventy", "Eighty", "Ninety")
+_ROMAN_DIGITS = (
+    (100, "C"), (90, "XC"), (50, "L"), (40, "XL"),
+    (10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I"),
+)
 
-INT_TO_WORDS = {
-    1: 'One', 2: 'Two', 3: 'Three', 4: 'Four', 5: 'Five',
-    6: 'Six', 7: 'Seven', 8: 'Eight', 9: 'Nine', 10: 'Ten',
-    11: 'Eleven', 12: 'Twelve', 13: 'Thirteen', 14: 'Fourteen', 15: 'Fifteen',
-    16: 'Sixteen', 17: 'Seventeen', 18: 'Eighteen', 19: 'Nineteen', 20: 'Twenty',
-    21: 'Twenty-one', 22: 'Twenty-two', 23: 'Twenty-three', 24: 'Twenty-four', 25: 'Twenty-five',
-    26: 'Twenty-six', 27: 'Twenty-seven', 28: 'Twenty-eight', 29: 'Twenty-nine', 30: 'Thirty',
-    31: 'Thirty-one', 32: 'Thirty-two', 33: 'Thirty-three', 34: 'Thirty-four', 35: 'Thirty-five',
-    36: 'Thirty-six', 37: 'Thirty-seven', 38: 'Thirty-eight', 39: 'Thirty-nine', 40: 'Forty',
-    41: 'Forty-one', 42: 'Forty-two', 43: 'Forty-three', 44: 'Forty-four', 45: 'Forty-five',
-    46: 'Forty-six', 47: 'Forty-seven', 48: 'Forty-eight', 49: 'Forty-nine', 50: 'Fifty',
-    60: 'Sixty', 70: 'Seventy', 80: 'Eighty', 90: 'Ninety', 100: 'One hundred',
-}
+
+def _spell_number(number: int) -> str:
+    if number == 100:
+        return "One hundred"
+    if number < 20:
+        return _ONES[number]
+    tens, ones = divmod(number, 10)
+    return _TENS[tens] if not ones else f"{_TENS[tens]}-{_ONES[ones].lower()}"
+
+
+def _to_roman(number: int) -> str:
+    digits = []
+    for value, numeral in _ROMAN_DIGITS:
+        count, number = divmod(number, value)
+        digits.append(numeral * count)
+    return "".join(digits)
+
+
+# Chapter numbers 1-100, built once at import. The hand-written tables skipped
+# 51-59, 61-69 and so on, so "LV" or "LXIV" headings were never spoken.
+ROMAN_TO_INT = {_to_roman(number): number for number in range(1, 101)}
+INT_TO_WORDS = {number: _spell_number(number) for number in range(1, 101)}
 
 
 ELLIPSIS_PATTERN = re.compile(r"(\.\s+){2,}\.")
@@ -170,23 +179,28 @@ def _convert_roman_numeral_to_spoken(text: str, segment: Segment) -> str:
     if not (is_heading or is_first_in_file):
         return text
 
-    # Check if text matches Roman numeral pattern
-    match = ROMAN_NUMERAL_PATTERN.match(text.strip())
+    converted = _convert_roman_title(text.strip())
+    return text if converted is None else converted
+
+
+@lru_cache(maxsize=1024)
+def _convert_roman_title(text: str) -> str | None:
+    """Spoken form of a Roman numeral title, or None if *text* is not one.
+
+    Cached: the same heading strings recur across every chapter of a book.
+    """
+    match = ROMAN_NUMERAL_PATTERN.match(text)
     if not match:
-        return text
+        return None
 
     prefix = match.group(1) or ""  # Chapter/Part/Book
     roman = match.group(2).upper()  # The Roman numeral
     suffix = match.group(3) or ""  # Punctuation
 
     # Look up the Roman numeral
-    if roman not in ROMAN_TO_INT:
-        return text  # Invalid Roman numeral, leave unchanged
-
-    # Convert to integer then to words
-    number = ROMAN_TO_INT[roman]
-    if number not in INT_TO_WORDS:
-        return text  # Number not in our mapping, leave unchanged
+    number = ROMAN_TO_INT.get(roman)
+    if number is None:
+        return None  # Invalid or above 100, leave unchanged
 
     words = INT_TO_WORDS[number]
 
@@ -197,7 +211,6 @@ def _convert_roman_numeral_to_spoken(text: str, segment: Segment) -> str:
         return f"{words}{suffix}"
 
 
-
 NOTEREF_HINTS = ("footnote", "noteref", "endnote", "fn", "note")
 
 
@@ -12,6 +12,10 @@ try:
 except Exception:  # pragma: no cover - optional dependency
     yaml = None
 
+# libyaml's C parser is several times faster than the pure-Python one and is
+# read on every CLI invocation; PyYAML builds without libyaml lack it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
 
 def _parse_env_file(path: Path) -> dict[str, str]:
     """Parse .env file into dictionary."""
@@ -36,7 +40,7 @@ def _parse_yaml_file(path: Path) -> dict[str, Any]:
     if not text.strip():
         return {}
     if yaml:
-        loaded = yaml.safe_load(text)
+        loaded = yaml.load(text, Loader=_YAML_LOADER)
         return loaded or {}
     # No usable fallback: the previous one handled only top-level "key: value"
     # pairs, so it silently misparsed the nested providers block, lists, and the
@@ -203,10 +203,13 @@ class AppSettings(BaseModel):
             object.__setattr__(self, "state_file", self.work_dir / self.state_file)
 
     def ensure_directories(self) -> None:
-        # Create work_dir (which creates work_root as parent if needed)
-        self.work_dir.mkdir(parents=True, exist_ok=True)
-        self.segments_file.parent.mkdir(parents=True, exist_ok=True)
-        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        # Create work_dir (which creates work_root as parent if needed). The
+        # state files normally live directly in work_dir, so each distinct
+        # directory is created once instead of three times.
+        for directory in dict.fromkeys(
+            (self.work_dir, self.segments_file.parent, self.state_file.parent)
+        ):
+            directory.mkdir(parents=True, exist_ok=True)
 
     def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> AppSettings:  # type: ignore[override]
         if not update:
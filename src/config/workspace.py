@@ -138,6 +138,7 @@ def validate_for_translation(settings: AppSettings, input_epub: Path) -> None:
 def build_workspace_name(input_epub: Path) -> str:
     """Build workspace directory name from EPUB filename."""
     first_word = _extract_first_word(input_epub)
+    # The digest is part of on-disk workspace names; never change it.
     digest = hashlib.sha1(
         str(input_epub.expanduser().resolve(strict=False)).encode("utf-8")
     ).hexdigest()[:_WORKSPACE_HASH_LENGTH]
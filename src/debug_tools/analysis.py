@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
 from collections import Counter
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.panel import Panel
@@ -10,10 +12,15 @@ from rich.progress import Progress
 from rich.table import Table
 
 from config import AppSettings
-from epub_io.selector import analyze_skip_candidates
+from epub_io.selector import SkipAnalysis, analyze_skip_candidates
 
 from .common import console
 
+# Books are analysed independently and most of the time goes to zip reads and
+# libxml2 parsing, which release the GIL. Capped so a large machine does not
+# open dozens of archives at once.
+_MAX_ANALYSIS_WORKERS = 8
+
 
 def _iter_epubs(library: Path) -> Iterable[Path]:
     if library.is_file() and library.suffix.lower() == ".epub":
@@ -25,6 +32,15 @@ def _iter_epubs(library: Path) -> Iterable[Path]:
             yield path
 
 
+def _analyze_one(
+    epub_path: Path, settings: AppSettings
+) -> tuple[SkipAnalysis | None, str | None]:
+    try:
+        return analyze_skip_candidates(epub_path, settings), None
+    except Exception as exc:
+        return None, str(exc)
+
+
 def analyze_library(
     settings: AppSettings,
     library: Path,
@@ -52,14 +68,19 @@ def analyze_library(
     books_with_skips = 0
     errors: list[tuple[Path, str]] = []
 
+    # At least one worker: a limit of 0 leaves no books, but the summary is
+    # still printed, and ThreadPoolExecutor rejects max_workers=0.
+    workers = max(1, min(_MAX_ANALYSIS_WORKERS, os.cpu_count() or 1, len(epubs)))
+
     # Progress built its own Console, so --quiet did not suppress it.
-    with Progress(console=console) as progress:
+    with Progress(console=console) as progress, ThreadPoolExecutor(workers) as executor:
         task = progress.add_task("Analyzing", total=len(epubs))
-        for epub_path in epubs:
-            try:
-                analysis = analyze_skip_candidates(epub_path, settings)
-            except Exception as exc:  # pragma: no cover - surfaced in output
-                errors.append((epub_path, str(exc)))
+        # map() yields in submission order, so counter tie-breaks and the error
+        # list come out the same as a serial run.
+        results = executor.map(lambda path: _analyze_one(path, settings), epubs)
+        for epub_path, (analysis, error) in zip(epubs, results, strict=True):
+            if error is not None:
+                errors.append((epub_path, error))
                 progress.advance(task)
                 continue
 
@@ -3,8 +3,13 @@
 from __future__ import annotations
 
 import posixpath
+from collections.abc import Callable
+from functools import lru_cache, partial
 from pathlib import Path, PurePosixPath
 
+_REJECTED_PREFIXES = ("data:", "mailto:", "tel:", "blob:", "javascript:", "//")
+_MAX_PREFIX_LENGTH = max(map(len, _REJECTED_PREFIXES))
+
 
 def normalize_epub_href(document_path: Path, raw_href: str) -> str | None:
     """Normalize EPUB href relative to document path.
@@ -33,6 +38,19 @@ def normalize_epub_href(document_path: Path, raw_href: str) -> str | None:
         >>> normalize_epub_href(Path("text/chapter1.xhtml"), "http://example.com/img.jpg")
         None
     """
+    return _normalize_raw_href(document_path.as_posix(), raw_href)
+
+
+def href_normalizer(document_path: Path) -> Callable[[str], str | None]:
+    """Return ``normalize_epub_href`` bound to one document.
+
+    Callers resolving every href in a document convert its path once rather
+    than once per href.
+    """
+    return partial(_normalize_raw_href, document_path.as_posix())
+
+
+def _normalize_raw_href(document_posix: str, raw_href: str) -> str | None:
     # Validate input
     if not raw_href:
         return None
@@ -44,33 +62,38 @@ def normalize_epub_href(document_path: Path, raw_href: str) -> str | None:
     # Filter out data URIs and external URLs. Only "://" was checked, so
     # schemes without an authority (mailto:, tel:) and protocol-relative URLs
     # ("//host/path") were treated as ordinary relative paths and resolved
-    # against the document directory.
-    lowered = value.lower()
-    if lowered.startswith(("data:", "mailto:", "tel:", "blob:", "javascript:", "//")):
+    # against the document directory. Only the prefix is lowercased, since a
+    # data URI can run to megabytes; rejecting here also keeps such values out
+    # of the cache below.
+    if value[:_MAX_PREFIX_LENGTH].lower().startswith(_REJECTED_PREFIXES):
         return None
     if "://" in value:
         return None
 
-    # Convert document path to POSIX for consistent handling
-    doc_posix = PurePosixPath(document_path.as_posix())
+    # The same stylesheet, nav and image hrefs recur across every chapter, and
+    # the result depends only on these two strings.
+    return _normalize_href(document_posix, value)
+
 
-    # Resolve href relative to document's directory
+@lru_cache(maxsize=8192)
+def _normalize_href(document_posix: str, value: str) -> str | None:
+    # Plain string operations: the PurePosixPath objects built here were only
+    # ever turned straight back into strings.
     if value.startswith("/"):
         # Absolute path within EPUB (relative to EPUB root)
-        candidate = PurePosixPath(value.lstrip("/"))
+        candidate = value.lstrip("/")
     else:
         # Relative path (relative to document's directory)
-        doc_dir = doc_posix.parent
-        candidate = doc_dir.joinpath(PurePosixPath(value))
+        candidate = posixpath.join(posixpath.dirname(document_posix), value)
 
     # Normalize the path (resolve .. and .)
-    normalized = PurePosixPath(posixpath.normpath(str(candidate)))
+    normalized = posixpath.normpath(candidate)
 
     # Reject paths that traverse outside EPUB root
-    if normalized.as_posix().startswith("../"):
+    if normalized.startswith("../"):
         return None
 
-    return normalized.as_posix()
+    return normalized
 
 
 def safe_relative_member(internal_path: str, source: Path) -> PurePosixPath:
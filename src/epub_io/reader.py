@@ -8,7 +8,7 @@ from lxml import html
 
 from config import AppSettings
 
-from .resources import SpineItem, get_item_by_href, iter_spine_items, load_book
+from .resources import SpineItem, index_items_by_href, iter_spine_items, load_book
 
 # Maximum EPUB file size: 500MB
 MAX_EPUB_SIZE = 500 * 1024 * 1024
@@ -26,15 +26,23 @@ class HtmlDocument:
 
 
 class EpubReader:
-    def __init__(self, epub_path: Path, settings: AppSettings):
+    def __init__(self, epub_path: Path, settings: AppSettings, *, structure_only: bool = False):
+        """Open an EPUB.
+
+        With structure_only, only the spine, TOC and metadata are loaded;
+        document bodies are left unread, so iter_documents is unavailable.
+        """
         self.epub_path = epub_path
         self.settings = settings
+        self.structure_only = structure_only
 
-        # Validate file size before processing
-        if not epub_path.exists():
-            raise FileNotFoundError(f"EPUB file not found: {epub_path}")
+        # Validate file size before processing. One stat answers both
+        # questions; exists() followed by stat() asked the filesystem twice.
+        try:
+            file_size = epub_path.stat().st_size
+        except (FileNotFoundError, NotADirectoryError):
+            raise FileNotFoundError(f"EPUB file not found: {epub_path}") from None
 
-        file_size = epub_path.stat().st_size
         if file_size > MAX_EPUB_SIZE:
             size_mb = file_size / (1024 * 1024)
             max_mb = MAX_EPUB_SIZE / (1024 * 1024)
@@ -42,13 +50,17 @@ class EpubReader:
                 f"EPUB file too large: {size_mb:.1f}MB (maximum: {max_mb:.0f}MB)"
             )
 
-        self.book = load_book(epub_path)
+        self.book = load_book(epub_path, structure_only=structure_only)
 
     def iter_documents(self) -> Iterable[HtmlDocument]:
+        if self.structure_only:
+            raise RuntimeError("Document bodies were not loaded for this EPUB")
+        items_by_href = index_items_by_href(self.book)
         for spine_item in iter_spine_items(self.book):
             if not spine_item.media_type.startswith("application/xhtml"):
                 continue
-            item = get_item_by_href(self.book, spine_item.href)
+            # Spine items are built from manifest entries, so this always hits.
+            item = items_by_href[spine_item.href.as_posix()]
             raw_html: bytes = item.get_content()
             tree = html.fromstring(raw_html)
             yield HtmlDocument(spine_item=spine_item, tree=tree, raw_html=raw_html)
@@ -1,14 +1,28 @@
 from __future__ import annotations
 
+import posixpath
 import warnings
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
+from urllib.parse import unquote
 
 from ebooklib import epub
 
 from logging_utils.logger import get_logger
 
+# Installed once at import rather than per load: warnings.catch_warnings()
+# swaps process-wide filter state, so concurrent load_book calls from worker
+# threads could restore each other's filters and leak or lose warnings.
+warnings.filterwarnings(
+    "ignore",
+    message="In the future version we will turn default option ignore_ncx to True.",
+)
+warnings.filterwarnings(
+    "ignore",
+    message="This search incorrectly ignores the root element",
+)
+
 
 @dataclass
 class SpineItem:
@@ -19,17 +33,64 @@ class SpineItem:
     linear: bool
 
 
-def load_book(epub_path: Path) -> epub.EpubBook:
-    with warnings.catch_warnings():
-        warnings.filterwarnings(
-            "ignore",
-            message="In the future version we will turn default option ignore_ncx to True.",
-        )
-        warnings.filterwarnings(
-            "ignore",
-            message="This search incorrectly ignores the root element",
-        )
-        return epub.read_epub(str(epub_path), options={"ignore_ncx": False})
+class _StructureOnlyReader(epub.EpubReader):
+    """ebooklib reader that leaves chapter and asset bodies unread.
+
+    ebooklib decompresses every manifest member while loading. Spine and TOC
+    inspection needs only the OPF, the NCX and the nav document, so every other
+    item is given empty content. Missing members still raise KeyError as
+    they would for a full load.
+    """
+
+    _structural: frozenset[str] | None = None
+
+    def _load_manifest(self):
+        opf = epub.NAMESPACES["OPF"]
+        manifest = self.container.find(f"{{{opf}}}manifest")
+        spine = self.container.find(f"{{{opf}}}spine")
+        # ebooklib reads the NCX through <spine toc="...">, whatever media type
+        # the manifest declares for it, so matching on media type alone left
+        # NCX files declared as e.g. "text/xml" empty and unparseable.
+        toc_id = spine.get("toc") if spine is not None else None
+        names: set[str] = set()
+        for item in manifest if manifest is not None else ():
+            href = item.get("href")
+            if not href:
+                continue
+            if (
+                (toc_id and item.get("id") == toc_id)
+                or item.get("media-type") == "application/x-dtbncx+xml"
+                or "nav" in (item.get("properties") or "").split()
+            ):
+                # ebooklib reads the nav document by its raw href but the NCX
+                # by its unquoted one, so both spellings are admitted.
+                for name in (href, unquote(href)):
+                    names.add(posixpath.normpath(posixpath.join(self.opf_dir, name)))
+        self._structural = frozenset(names)
+        super()._load_manifest()
+
+    def read_file(self, name):
+        if self._structural is None:
+            return super().read_file(name)
+        name = posixpath.normpath(name)
+        getinfo = getattr(self.zf, "getinfo", None)
+        # Only a zip archive can confirm a member exists without reading it;
+        # an unpacked (directory-backed) book is read in full, which costs no
+        # decompression anyway.
+        if name in self._structural or getinfo is None:
+            return super().read_file(name)
+        getinfo(name)
+        return b""
+
+
+def load_book(epub_path: Path, *, structure_only: bool = False) -> epub.EpubBook:
+    options = {"ignore_ncx": False}
+    if not structure_only:
+        return epub.read_epub(str(epub_path), options=options)
+    reader = _StructureOnlyReader(str(epub_path), options)
+    book = reader.load()
+    reader.process()
+    return book
 
 
 logger = get_logger(__name__)
@@ -59,6 +120,18 @@ def iter_spine_items(book: epub.EpubBook) -> Iterable[SpineItem]:
         )
 
 
+def index_items_by_href(book: epub.EpubBook) -> dict[str, epub.EpubItem]:
+    """Map each manifest file name to its item, keeping the first on duplicates.
+
+    get_item_by_href scans the whole manifest per call; callers resolving every
+    spine document build this once instead.
+    """
+    index: dict[str, epub.EpubItem] = {}
+    for item in book.get_items():
+        index.setdefault(item.file_name, item)
+    return index
+
+
 def get_item_by_href(book: epub.EpubBook, href: Path):
     # ebooklib stores file_name using forward slashes
     target = href.as_posix()
@@ -14,13 +14,15 @@ from .reader import EpubReader
 from .resources import SpineItem, iter_spine_items
 
 
-@dataclass
+@dataclass(slots=True)
 class SkipAnalysis:
     candidates: list[SkipCandidate]
     toc_unmatched_titles: list[str]
 
 
-@dataclass
+# Slotted: a library scan holds one candidate per skipped spine item. Not
+# frozen, since build_skip_map records the user's choice on ``flagged``.
+@dataclass(slots=True)
 class SkipCandidate:
     file_path: Path
     spine_index: int
@@ -184,7 +186,9 @@ def _apply_skip_after_logic(
 
 
 def analyze_skip_candidates(epub_path: Path, settings: AppSettings) -> SkipAnalysis:
-    reader = EpubReader(epub_path, settings)
+    # Skip detection reads only the spine and TOC, so chapter bodies are never
+    # decompressed; over a library this is most of the I/O.
+    reader = EpubReader(epub_path, settings, structure_only=True)
     keywords = [rule.keyword for rule in settings.skip_rules]
     spine_lookup = {item.href: item for item in iter_spine_items(reader.book)}
 
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from epub_io.reader import EpubReader
 
+_EXHAUSTED = object()
+
 
 def parse_toc_to_dict(reader: EpubReader) -> dict[str, str]:
     """Extract TOC titles mapped by document href.
@@ -44,21 +46,24 @@ def parse_toc_to_dict(reader: EpubReader) -> dict[str, str]:
         if not mapping.get(href):
             mapping[href] = title
 
-    def recurse(entries):
-        """Recursively traverse TOC entries."""
-        for item in entries:
-            # Handle direct Link objects
-            if hasattr(item, "href") and hasattr(item, "title"):
-                _record(item)
-            # Handle nested tuple/list structure (older EpubPy format)
-            elif isinstance(item, (list, tuple)) and item:
-                head = item[0]
-                if hasattr(head, "href") and hasattr(head, "title"):
-                    _record(head)
-                # Recurse into children if they exist
-                if len(item) > 1:
-                    recurse(item[1])
-
-    toc = reader.book.toc or []
-    recurse(toc)
+    # Explicit stack of iterators rather than recursion, so a deeply nested TOC
+    # cannot hit the recursion limit. Each level is consumed in order, which the
+    # first-entry-wins rule in _record depends on.
+    stack = [iter(reader.book.toc or [])]
+    while stack:
+        item = next(stack[-1], _EXHAUSTED)
+        if item is _EXHAUSTED:
+            stack.pop()
+            continue
+        # Handle direct Link objects
+        if hasattr(item, "href") and hasattr(item, "title"):
+            _record(item)
+        # Handle nested tuple/list structure (older EpubPy format)
+        elif isinstance(item, (list, tuple)) and item:
+            head = item[0]
+            if hasattr(head, "href") and hasattr(head, "title"):
+                _record(head)
+            # Descend into children if they exist
+            if len(item) > 1:
+                stack.append(iter(item[1]))
     return mapping
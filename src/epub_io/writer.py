@@ -22,7 +22,7 @@ def write_updated_epub(
     output_epub: Path,
     updated_html: dict[Path, bytes],
     *,
-    toc_updates: dict[PurePosixPath, dict[str | None, str]] | None = None,
+    toc_updates: dict[str, dict[str | None, str]] | None = None,
     css_mode: str = "bilingual",
 ) -> None:
     book = load_book(input_epub)
@@ -51,8 +51,11 @@ def _append_translated_only_css(book: epub.EpubBook) -> None:
 
 
 def _rewrite_toc_titles(
-    book: epub.EpubBook, toc_updates: dict[PurePosixPath, dict[str | None, str]]
+    book: epub.EpubBook, toc_updates: dict[str, dict[str | None, str]]
 ) -> None:
+    # str() also accepts PurePosixPath keys from older callers.
+    updates_by_href = {str(path): updates for path, updates in toc_updates.items()}
+
     def recurse(entries):
         for entry in entries:
             if isinstance(entry, (list, tuple)):
@@ -64,30 +67,21 @@ def _rewrite_toc_titles(
             href = getattr(entry, "href", None)
             if href is None or not hasattr(entry, "title"):
                 continue
-            path, fragment = _split_href(href)
-            title = _lookup_title(toc_updates, path, fragment)
+            title = _lookup_title(updates_by_href, href)
             if title:
                 entry.title = title
 
     recurse(book.toc)
 
 
-def _split_href(href: str | None) -> tuple[PurePosixPath, str | None]:
-    if not href:
-        return PurePosixPath(""), None
-    if "#" in href:
-        path_part, fragment = href.split("#", 1)
-    else:
-        path_part, fragment = href, None
-    return PurePosixPath(path_part), fragment
-
-
-def _lookup_title(
-    toc_updates: dict[PurePosixPath, dict[str | None, str]],
-    path: PurePosixPath,
-    fragment: str | None,
-) -> str | None:
-    updates = toc_updates.get(path)
+def _lookup_title(updates_by_href: dict[str, dict[str | None, str]], href: str) -> str | None:
+    path_part, _, fragment = href.partition("#")
+    # Each TOC entry is looked up by its raw href rather than by a PurePosixPath
+    # built per entry. Keys are already in normalised form; the path is only
+    # rebuilt for an href that misses.
+    updates = updates_by_href.get(path_part)
+    if updates is None:
+        updates = updates_by_href.get(str(PurePosixPath(path_part)))
     if not updates:
         return None
     if fragment and fragment in updates:
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import re
 
+# Run once per extracted segment, so compiled here rather than looked up in
+# re's pattern cache on every call.
+_SPACED_ELLIPSIS = re.compile(r"\.\s+\.\s+\.(?:\s+\.)*")
+_ELLIPSIS_SPACING = re.compile(r"\.\.\.\s*(?=\S)")
+
 
 def normalize_whitespace(text: str) -> str:
     return " ".join(text.split())
@@ -21,7 +26,9 @@ def normalize_punctuation(text: str) -> str:
         Text with normalized punctuation
     """
     # Replace spaced dots (. . . or . . . .) with standard ellipsis
-    text = re.sub(r"\.\s+\.\s+\.(?:\s+\.)*", "...", text)
-    # Ensure exactly one space after ellipsis when followed by non-whitespace
-    text = re.sub(r"\.\.\.\s*(?=\S)", "... ", text)
+    text = _SPACED_ELLIPSIS.sub("...", text)
+    # Ensure exactly one space after ellipsis when followed by non-whitespace.
+    # Most segments contain no ellipsis at all, so skip the second scan for them.
+    if "..." in text:
+        text = _ELLIPSIS_SPACING.sub("... ", text)
     return text
@@ -2,17 +2,37 @@
 
 from __future__ import annotations
 
+import os
+import shutil
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path, PurePosixPath
 
 from epub_io.path_utils import safe_relative_member
 
+# Members are independent and the time goes to zlib inflation and file writes,
+# both of which release the GIL. Capped so a large machine does not open dozens
+# of handles on one archive.
+_MAX_EXTRACT_WORKERS = 8
+
 
 def _safe_relative_member(internal_path: str, epub_path: Path) -> PurePosixPath:
     """Validate an archive member name (see epub_io.path_utils.safe_relative_member)."""
     return safe_relative_member(internal_path, epub_path)
 
 
+def _copy_members(input_epub: Path, plan: list[tuple[str, Path]]) -> None:
+    # Each worker opens its own ZipFile: one handle shared across threads
+    # serialises every read behind its file lock.
+    with zipfile.ZipFile(input_epub, "r") as epub_zip:
+        for internal_path, output_path in plan:
+            # Copying through a fixed buffer keeps a large member (audio, video,
+            # big images) from being held in memory whole.
+            with epub_zip.open(internal_path) as source, output_path.open("wb") as dest:
+                shutil.copyfileobj(source, dest, 1 << 20)
+
+
 def extract_epub_structure(
     input_epub: Path,
     output_dir: Path,
@@ -64,20 +84,19 @@ def extract_epub_structure(
             # Validate every member up front. Validating inside the write loop
             # meant a malicious member partway through an archive was rejected
             # only after everything before it had already been written to disk.
-            for candidate in file_list:
-                if not candidate.endswith("/"):
-                    _safe_relative_member(candidate, input_epub)
+            members = {
+                candidate: _safe_relative_member(candidate, input_epub)
+                for candidate in file_list
+                if not candidate.endswith("/")
+            }
 
             # Flattening collapses distinct members onto one name; track what we
             # have written so a collision does not silently destroy the earlier file.
             used_names: dict[str, str] = {}
+            created_dirs: set[Path] = set()
 
-            for internal_path in file_list:
-                # Skip directories (they end with /)
-                if internal_path.endswith("/"):
-                    continue
-
-                member = _safe_relative_member(internal_path, input_epub)
+            # Directories (names ending in /) were left out of members above.
+            for internal_path, member in members.items():
 
                 # Determine output path
                 if preserve_structure:
@@ -98,16 +117,25 @@ def extract_epub_structure(
                     used_names[filename] = internal_path
                     output_path = output_dir / filename
 
-                # Create parent directories if needed
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-
-                # Extract file
-                with epub_zip.open(internal_path) as source:
-                    output_path.write_bytes(source.read())
+                # Create parent directories if needed, once per directory
+                if output_path.parent not in created_dirs:
+                    output_path.parent.mkdir(parents=True, exist_ok=True)
+                    created_dirs.add(output_path.parent)
 
-                # Store mapping
                 mapping[internal_path] = output_path
 
+        # Names and directories are settled above, in member order, so the
+        # copies below can run in any order without changing the result.
+        plan = list(mapping.items())
+        workers = min(_MAX_EXTRACT_WORKERS, os.cpu_count() or 1, len(plan))
+        if workers <= 1:
+            _copy_members(input_epub, plan)
+        else:
+            with ThreadPoolExecutor(workers) as executor:
+                # Consuming the results re-raises the first worker failure.
+                slices = (plan[offset::workers] for offset in range(workers))
+                list(executor.map(partial(_copy_members, input_epub), slices))
+
     except zipfile.BadZipFile as e:
         raise zipfile.BadZipFile(f"Invalid EPUB/ZIP file: {input_epub}") from e
 
@@ -134,29 +162,33 @@ def get_epub_metadata_files(mapping: dict[str, Path]) -> dict[str, Path]:
         >>> print(metadata['opf'])
         PosixPath('workspace/epub_raw/OEBPS/content.opf')
     """
-    result: dict[str, Path] = {}
-
-    # An EPUB may legitimately carry several .opf/.ncx files. Iterating the mapping
-    # and overwriting made the winner depend on dict order; pick deterministically
-    # instead — shallowest path first, then alphabetically.
-    def _rank(internal_path: str) -> tuple[int, str]:
-        normalized = internal_path.replace("\\", "/")
-        return (normalized.count("/"), normalized.lower())
-
-    for internal_path in sorted(mapping, key=_rank):
-        extracted_path = mapping[internal_path]
+    # One pass classifies each entry, normalising its name once; only the few
+    # matches are ranked, rather than sorting every asset in the book.
+    matches: list[tuple[int, str, str, Path]] = []
+    for internal_path, extracted_path in mapping.items():
         normalized = internal_path.replace("\\", "/").lower()
         basename = normalized.rsplit("/", 1)[-1]
 
         if normalized == "mimetype":
-            result.setdefault("mimetype", extracted_path)
+            kind = "mimetype"
         elif basename == "container.xml":
             # Match the basename, not a substring: "OEBPS/not-a-container.xml.html"
             # previously matched and could shadow the real META-INF/container.xml.
-            result.setdefault("container", extracted_path)
+            kind = "container"
         elif basename.endswith(".opf"):
-            result.setdefault("opf", extracted_path)
+            kind = "opf"
         elif basename.endswith(".ncx"):
-            result.setdefault("ncx", extracted_path)
+            kind = "ncx"
+        else:
+            continue
+        matches.append((normalized.count("/"), normalized, kind, extracted_path))
+
+    # An EPUB may legitimately carry several .opf/.ncx files. Iterating the mapping
+    # and overwriting made the winner depend on dict order; pick deterministically
+    # instead — shallowest path first, then alphabetically.
+    matches.sort(key=lambda match: match[:2])
+    result: dict[str, Path] = {}
+    for _depth, _name, kind, extracted_path in matches:
+        result.setdefault(kind, extracted_path)
 
     return result
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import os
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -19,17 +22,24 @@ class ImageInfo:
     is_cover_candidate: bool = False
 
 
+# Image bodies are already in memory once the book is loaded, so what remains is
+# file writes, which release the GIL.
+_MAX_WRITE_WORKERS = 8
+
 # Supported image extensions
-IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".bmp"}
+IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".gif", ".webp", ".svg", ".bmp"})
 
 
 def _is_image_item(item) -> bool:
     """Check if an EPUB item is an image."""
-    if hasattr(item, "media_type"):
-        return item.media_type.startswith("image/")
-    if hasattr(item, "file_name"):
-        ext = Path(item.file_name).suffix.lower()
-        return ext in IMAGE_EXTENSIONS
+    # Called for every manifest entry; a declared media type decides on its
+    # own, and the extension is read without building a Path.
+    media_type = getattr(item, "media_type", None)
+    if media_type is not None:
+        return media_type.startswith("image/")
+    file_name = getattr(item, "file_name", None)
+    if file_name is not None:
+        return posixpath.splitext(file_name)[1].lower() in IMAGE_EXTENSIONS
     return False
 
 
@@ -80,6 +90,7 @@ def extract_images(
     # so a rerun saw every prior output as a duplicate and emitted image_1.jpg,
     # image_2.jpg, … growing without bound and leaving stale files behind.
     used_names: set[str] = set()
+    pending_writes: list[tuple[Path, bytes]] = []
 
     # Extract all image items from EPUB
     for item in reader.book.get_items():
@@ -110,9 +121,7 @@ def extract_images(
             used_names.discard(output_filename)
             continue
 
-        # Write failures are NOT recoverable: swallowing them produced an export
-        # that reported success while silently missing images.
-        output_path.write_bytes(content)
+        pending_writes.append((output_path, content))
 
         # Check if this could be a cover
         is_cover_candidate = _is_potential_cover(epub_path, not seen_first_manifest_image)
@@ -126,6 +135,17 @@ def extract_images(
             )
         )
 
+    # Write failures are NOT recoverable: swallowing them produced an export
+    # that reported success while silently missing images. Consuming map()
+    # re-raises the first one.
+    workers = min(_MAX_WRITE_WORKERS, os.cpu_count() or 1, len(pending_writes))
+    if workers <= 1:
+        for output_path, content in pending_writes:
+            output_path.write_bytes(content)
+    else:
+        with ThreadPoolExecutor(workers) as executor:
+            list(executor.map(lambda write: write[0].write_bytes(write[1]), pending_writes))
+
     return extracted_images
 
 
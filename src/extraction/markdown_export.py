@@ -10,7 +10,7 @@ from lxml import html as lxml_html
 
 from config import AppSettings
 from console_singleton import get_console
-from epub_io.path_utils import normalize_epub_href
+from epub_io.path_utils import href_normalizer
 from epub_io.reader import EpubReader
 from epub_io.resources import iter_spine_items
 from state.models import Segment
@@ -204,11 +204,17 @@ def _build_chapter_blocks(
     return blocks
 
 
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*!]')
+_WHITESPACE_RUN = re.compile(r"\s+")
+# Same tags the image rewrite below selects.
+_IMAGE_TAG = re.compile(r"<(?:img|image)\b", re.IGNORECASE)
+
+
 def _sanitize_filename(title: str, max_length: int = 50) -> str:
     """Convert title to safe filename component."""
     # Remove or replace unsafe characters
-    safe = re.sub(r'[<>:"/\\|?*!]', "", title)
-    safe = re.sub(r"\s+", "-", safe.strip())
+    safe = _UNSAFE_FILENAME_CHARS.sub("", title)
+    safe = _WHITESPACE_RUN.sub("-", safe.strip())
     safe = safe.lower()
     # Remove leading/trailing hyphens
     safe = safe.strip("-")
@@ -250,9 +256,14 @@ def _html_to_markdown(
         # Convert HTML to markdown
         markdown = h.handle(html_content)
 
-        # Post-process: fix image paths to use images/ directory
-        # Parse to find image references and replace with correct paths
+        # Post-process: fix image paths to use images/ directory. This runs per
+        # segment and most segments are plain paragraphs, so the second parse
+        # is skipped unless an image tag is present and there is something to
+        # map it to.
+        if not image_mapping or not _IMAGE_TAG.search(html_content):
+            return markdown.strip()
         tree = lxml_html.fromstring(f"<div>{html_content}</div>")
+        normalize_href = href_normalizer(document_path)
         for img in tree.xpath(".//img | .//image"):
             src = img.get("src") or img.get("href") or img.get("{http://www.w3.org/1999/xlink}href")
             if src:
@@ -263,7 +274,7 @@ def _html_to_markdown(
                 # normalize_epub_href, which deliberately preserves both for document
                 # links (see tests/epub_io/test_path_utils.py).
                 lookup_src = unquote(src.split("#", 1)[0].split("?", 1)[0])
-                normalized_path = normalize_epub_href(document_path, lookup_src)
+                normalized_path = normalize_href(lookup_src)
                 if normalized_path and normalized_path in image_mapping:
                     extracted_name = image_mapping[normalized_path]
                     # Replace the path in markdown
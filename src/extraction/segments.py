@@ -7,7 +7,7 @@ from copy import deepcopy
 from itertools import count
 from pathlib import Path
 
-from lxml import html
+from lxml import etree, html
 
 from extraction.cleaners import normalize_punctuation
 from state.models import ExtractMode, Segment, SegmentMetadata
@@ -20,6 +20,12 @@ ATOMIC_TAGS = {"ul", "ol", "dl", "table", "figure"}
 # or is a leaf node (no same-tag descendants)
 SMART_EXTRACT_TAGS = {"blockquote", "div"}
 
+# lxml tag filters for the tags above. "{*}" matches with or without a
+# namespace, as _normalize_tag does, and lets the C iterators skip inline
+# markup, text and comments instead of handing every node to Python.
+_ATOMIC_TAG_FILTER = tuple(f"{{*}}{tag}" for tag in ATOMIC_TAGS)
+_SEGMENT_TAG_FILTER = tuple(f"{{*}}{tag}" for tag in sorted(SIMPLE_TAGS | ATOMIC_TAGS))
+
 BLOCK_LEVEL_TAGS = {
     "address",
     "article",
@@ -56,12 +62,7 @@ def _normalize_tag(tag: str) -> str:
 
 
 def _has_atomic_ancestor(element: html.HtmlElement) -> bool:
-    parent = element.getparent()
-    while parent is not None:
-        if _normalize_tag(parent.tag) in ATOMIC_TAGS:
-            return True
-        parent = parent.getparent()
-    return False
+    return next(element.iterancestors(*_ATOMIC_TAG_FILTER), None) is not None
 
 
 def _div_is_text_only(element: html.HtmlElement) -> bool:
@@ -146,7 +147,10 @@ def _has_direct_text_content(element: html.HtmlElement, exclude_tag: str) -> boo
 
 
 def _extract_text(element: html.HtmlElement) -> str:
-    text = " ".join(element.text_content().split())
+    # Serialising as text gives the same string as text_content() at about half
+    # the cost: it is one libxml2 call rather than an XPath string() evaluation.
+    raw = etree.tostring(element, method="text", encoding="unicode", with_tail=False)
+    text = " ".join(raw.split())
     return normalize_punctuation(text)
 
 
@@ -168,9 +172,9 @@ def _clean_html_copy(element: html.HtmlElement) -> html.HtmlElement:
                     node.set("src", src)
             else:
                 node.attrib.clear()
-    for bad_tag in list(clone.iter()):
-        if isinstance(bad_tag.tag, str) and bad_tag.tag.lower() in {"span", "a", "font"}:
-            bad_tag.drop_tag()
+    # The copy comes from the HTML parser, so tag names are already lower case;
+    # strip_tags unwraps them in one pass, keeping text and tails as drop_tag did.
+    etree.strip_tags(clone, "span", "a", "font")
     return clone
 
 
@@ -251,9 +255,7 @@ def iter_segments(
 ) -> Iterator[Segment]:
     order_counter = count(1)
     root_tree = tree.getroottree()
-    for element in tree.iter():
-        if not isinstance(element.tag, str):
-            continue
+    for element in tree.iter(*_SEGMENT_TAG_FILTER):
         tag = _normalize_tag(element.tag)
         if tag in ATOMIC_TAGS:
             if _has_atomic_ancestor(element):
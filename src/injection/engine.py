@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import re
 from collections import defaultdict
+from collections.abc import Callable
 from copy import deepcopy
-from pathlib import Path, PurePosixPath
+from functools import lru_cache
+from pathlib import Path
 
 from lxml import etree, html
 
@@ -46,6 +49,72 @@ def _group_translated_segments(settings: AppSettings) -> dict[Path, list[tuple[S
 HEADING_TAGS = {"h1", "h2", "h3", "h4"}
 
 
+@lru_cache(maxsize=4096)
+def _compiled_xpath(expression: str) -> etree.XPath:
+    # Segment xpaths are positional paths from getpath(), and the same ones
+    # ("/html/body/p[1]", ...) recur in every chapter; tree.xpath() recompiled
+    # each on every call.
+    return etree.XPath(expression)
+
+
+# One step of a getpath() result: a tag name with an optional 1-based position.
+_PATH_STEP = re.compile(r"([^\[\]/()*:@]+)(?:\[([1-9][0-9]*)\])?")
+
+
+def _segment_locator(root_tree) -> Callable[[str], list]:
+    """Return a resolver for the positional paths getpath() produced.
+
+    Evaluating "/html/body/p[700]" walks the 699 siblings before it, so
+    resolving every segment of a long chapter one xpath at a time was quadratic
+    in its length. Each parent's children are indexed by (tag, position) the
+    first time a path passes through it, making every later step a dict lookup.
+    Anything that is not a plain step (namespaced names, predicates written by
+    hand) goes through the compiled xpath instead.
+    """
+    root = root_tree.getroot()
+    child_indexes: dict[object, dict[tuple[str, int | None], object]] = {}
+
+    def _children(parent) -> dict[tuple[str, int | None], object]:
+        index = child_indexes.get(parent)
+        if index is None:
+            index = {}
+            counts: dict[str, int] = {}
+            for child in parent:
+                tag = child.tag
+                if not isinstance(tag, str):
+                    continue
+                position = counts[tag] = counts.get(tag, 0) + 1
+                index[(tag, position)] = child
+                # getpath() leaves the position off a tag that is unique among
+                # its siblings; a bare step selects the first match, as xpath does.
+                index.setdefault((tag, None), child)
+            child_indexes[parent] = index
+        return index
+
+    def resolve(xpath: str) -> list:
+        steps = xpath.split("/")
+        if len(steps) < 2 or steps[0]:
+            return _compiled_xpath(xpath)(root_tree)
+        node = None
+        for step in steps[1:]:
+            match = _PATH_STEP.fullmatch(step)
+            if match is None:
+                return _compiled_xpath(xpath)(root_tree)
+            tag, position = match.group(1), match.group(2)
+            key = (tag, int(position) if position else None)
+            if node is None:
+                if root.tag != tag or key[1] not in (None, 1):
+                    return []
+                node = root
+            else:
+                node = _children(node).get(key)
+                if node is None:
+                    return []
+        return [node]
+
+    return resolve
+
+
 def _restore_document_structure(document, raw_html: bytes) -> None:
     try:
         original_root = html.fromstring(raw_html)
@@ -72,18 +141,22 @@ def _apply_translations_to_document(
     document,
     segments: list[tuple[Segment, str]],
     mode: str,
-    title_updates: defaultdict[PurePosixPath, dict[str | None, str]],
+    title_updates: defaultdict[str, dict[str | None, str]],
 ) -> tuple[bool, list[str]]:
     updated = False
     failed_ids: list[str] = []
     tree = document.tree
-    root_tree = tree.getroottree()
-    for segment, translation in sorted(
+    locate = _segment_locator(tree.getroottree())
+    ordered = sorted(
         segments,
         key=lambda item: item[0].metadata.order_in_file,
         reverse=True,
-    ):
-        nodes = root_tree.xpath(segment.xpath)
+    )
+    # Resolve every path before touching the tree. Working backwards already
+    # kept each edit from shifting the positions of the segments still to come,
+    # so this finds the same elements the per-segment lookups did.
+    located = [(segment, translation, locate(segment.xpath)) for segment, translation in ordered]
+    for segment, translation, nodes in located:
         if not nodes:
             logger.warning("XPath not found for segment %s", segment.segment_id)
             failed_ids.append(segment.segment_id)
@@ -118,7 +191,7 @@ def _replace_with_translation(
 def _record_heading_title(
     file_path: Path,
     element: html.HtmlElement,
-    title_updates: defaultdict[PurePosixPath, dict[str | None, str]],
+    title_updates: defaultdict[str, dict[str | None, str]],
 ) -> None:
     tag = (element.tag or "").lower()
     if tag not in HEADING_TAGS:
@@ -126,8 +199,9 @@ def _record_heading_title(
     text = element.text_content().strip()
     if not text:
         return
-    key = PurePosixPath(file_path.as_posix())
-    updates = title_updates[key]
+    # Keyed by the document's POSIX path string, which is what the TOC writers
+    # compare hrefs against; a PurePosixPath per heading bought nothing.
+    updates = title_updates[file_path.as_posix()]
     element_id = element.get("id")
     if element_id:
         updates[element_id] = text
@@ -139,7 +213,7 @@ def apply_translations(
     input_epub: Path,
     *,
     mode: str | None = None,
-) -> tuple[dict[Path, bytes], dict[PurePosixPath, dict[str | None, str]]]:
+) -> tuple[dict[Path, bytes], dict[str, dict[str | None, str]]]:
     settings.ensure_directories()
 
     polish_if_chinese(
@@ -168,7 +242,7 @@ def apply_translations(
 
     updated_html: dict[Path, bytes] = {}
     effective_mode = mode or getattr(settings, "output_mode", "bilingual")
-    title_updates: defaultdict[PurePosixPath, dict[str | None, str]] = defaultdict(dict)
+    title_updates: defaultdict[str, dict[str | None, str]] = defaultdict(dict)
     failed_segments: list[str] = []
     missing_documents: list[Path] = []
     for file_path, segments in grouped.items():
@@ -213,7 +287,7 @@ def run_injection(
     output_epub: Path,
     *,
     mode: str = "bilingual",
-) -> tuple[dict[Path, bytes], dict[PurePosixPath, dict[str | None, str]]]:
+) -> tuple[dict[Path, bytes], dict[str, dict[str | None, str]]]:
     updated_html, title_updates = apply_translations(settings, input_epub, mode=mode)
     if not updated_html:
         return updated_html, title_updates
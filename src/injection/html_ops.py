@@ -5,11 +5,12 @@ from lxml import html
 from state.models import ExtractMode, Segment
 
 
-def _clone_element(element: html.HtmlElement) -> html.HtmlElement:
-    # with_tail=False: the tail belongs to the parent, not the element. Serialising
-    # it made non-whitespace tail text part of the clone (and could break
-    # fragment_fromstring, which rejects trailing content).
-    return html.fragment_fromstring(html.tostring(element, encoding="unicode", with_tail=False))
+def _shell_copy(element: html.HtmlElement) -> html.HtmlElement:
+    # Only the tag and attributes survive into the translation element: its
+    # text and children are replaced straight away. Cloning by serialising and
+    # re-parsing the whole original did that work per segment only to discard
+    # it. The tail is not copied; it belongs to the parent.
+    return element.makeelement(element.tag, element.attrib)
 
 
 def prepare_original(element: html.HtmlElement) -> None:
@@ -55,7 +56,7 @@ def _set_html_content(element: html.HtmlElement, markup: str) -> None:
 def build_translation_element(
     original: html.HtmlElement, segment: Segment, translation: str
 ) -> html.HtmlElement:
-    clone = _clone_element(original)
+    clone = _shell_copy(original)
     clone.attrib["data-lang"] = "translation"
     if segment.extract_mode == ExtractMode.TEXT:
         _set_text_only(clone, translation)
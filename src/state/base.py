@@ -10,7 +10,7 @@ import json
 import os
 import tempfile
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TypeVar
@@ -86,7 +86,11 @@ def atomic_write(path: Path, payload: dict) -> None:
     Example:
         >>> atomic_write(Path("state.json"), {"key": "value"})
     """
-    content = json.dumps(payload, indent=2, ensure_ascii=False)
+    _atomic_write_text(path, json.dumps(payload, indent=2, ensure_ascii=False))
+
+
+def _atomic_write_text(path: Path, content: str) -> None:
+    """Atomically replace ``path`` with already-serialised JSON ``content``."""
     path.parent.mkdir(parents=True, exist_ok=True)
 
     with state_file_lock(path):
@@ -145,8 +149,9 @@ def save_generic_state(document: TDocument, path: Path) -> None:
         >>> state = StateDocument(segments={}, ...)
         >>> save_generic_state(state, Path("state.json"))
     """
-    payload = json.loads(document.model_dump_json(indent=2))
-    atomic_write(path, payload)
+    # pydantic's serialiser already yields the final JSON text; it used to be
+    # parsed back into a dict only for atomic_write to encode it again.
+    _atomic_write_text(path, document.model_dump_json(indent=2))
 
 
 def update_state_item(
@@ -187,6 +192,31 @@ def update_state_item(
         return updated_state
 
 
+@contextmanager
+def batched_updates(path: Path, model_class: type[TDocument]) -> Iterator[TDocument]:
+    """
+    Load state once, allow any number of in-place edits, and save once.
+
+    update_state_item reads and rewrites the whole file for a single change;
+    callers making several related changes pay that per change. Here the
+    document is yielded for in-place mutation and written back when the block
+    exits normally. If the block raises, nothing is written.
+
+    Args:
+        path: Path to state file
+        model_class: Pydantic model class for the state document
+
+    Example:
+        >>> with batched_updates(Path("state.json"), StateDocument) as state:
+        ...     state.segments["a"].status = SegmentStatus.COMPLETED
+        ...     state.consecutive_failures = 0
+    """
+    with state_file_lock(path):
+        state = load_generic_state(path, model_class)
+        yield state
+        save_generic_state(state, path)
+
+
 def safe_load_state(
     path: Path,
     model_class: type[TDocument],
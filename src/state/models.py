@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class ExtractMode(str, Enum):
@@ -20,6 +22,11 @@ class SegmentStatus(str, Enum):
     ERROR = "error"
 
 
+@lru_cache(maxsize=4096)
+def _shared_path(value: str) -> Path:
+    return Path(value)
+
+
 class SegmentMetadata(BaseModel):
     element_type: str
     spine_index: int
@@ -37,6 +44,20 @@ class Segment(BaseModel):
     skip_reason: str | None = Field(None, description="Reason for skipping (e.g., 'cover', 'index')")
     skip_source: str | None = Field(None, description="Source of skip decision (e.g., 'content', 'rule')")
 
+    @field_validator("file_path", mode="plain")
+    @classmethod
+    def _share_file_path(cls, value: object) -> Path:
+        # A book has thousands of segments but only a few dozen documents.
+        # Building a fresh Path for each one was over half the cost of loading
+        # segments.json; equal strings now share one immutable Path.
+        if isinstance(value, Path):
+            return value
+        if isinstance(value, str):
+            return _shared_path(value)
+        if isinstance(value, os.PathLike):
+            return Path(value)
+        raise ValueError("Input is not a valid path")
+
 
 class TranslationRecord(BaseModel):
     model_config = {"protected_namespaces": ()}
@@ -5,7 +5,7 @@ from collections.abc import Iterable
 from datetime import datetime
 from pathlib import Path
 
-from .base import load_generic_state, save_generic_state, state_file_lock
+from .base import batched_updates, load_generic_state, save_generic_state, state_file_lock
 from .models import (
     ResumeInfo,
     Segment,
@@ -116,16 +116,56 @@ def update_translation_record(state_path: Path, segment_id: str, updater) -> Tra
         return updated
 
 
+def _with_status(record: TranslationRecord, status: SegmentStatus, fields) -> TranslationRecord:
+    payload = record.model_dump()
+    payload.update(fields)
+    payload["status"] = status
+    return TranslationRecord.model_validate(payload)
+
+
 def mark_status(
     state_path: Path, segment_id: str, status: SegmentStatus, **fields
 ) -> TranslationRecord:
-    def _updater(record: TranslationRecord) -> TranslationRecord:
-        payload = record.model_dump()
-        payload.update(fields)
-        payload["status"] = status
-        return TranslationRecord.model_validate(payload)
+    return update_translation_record(
+        state_path, segment_id, lambda record: _with_status(record, status, fields)
+    )
+
+
+def _require_record(state: StateDocument, segment_id: str) -> TranslationRecord:
+    record = state.segments.get(segment_id)
+    if record is None:
+        raise KeyError(f"Segment {segment_id} missing from state file")
+    return record
+
+
+def mark_completed(state_path: Path, segment_id: str, **fields) -> TranslationRecord:
+    """Mark a segment COMPLETED and clear the consecutive-failure counter.
 
-    return update_translation_record(state_path, segment_id, _updater)
+    The translate loop did this as mark_status followed by
+    set_consecutive_failures, reading and rewriting the whole state file twice
+    for every translated segment.
+    """
+    with _get_lock(state_path), batched_updates(state_path, StateDocument) as state:
+        updated = _with_status(_require_record(state, segment_id), SegmentStatus.COMPLETED, fields)
+        state.segments[segment_id] = updated
+        state.consecutive_failures = 0
+        return updated
+
+
+def mark_failed(state_path: Path, segment_id: str, error_message: str) -> int:
+    """Mark a segment ERROR and count it as a consecutive failure.
+
+    Returns the new consecutive-failure count, which previously took a third
+    load of the state file after the two writes.
+    """
+    with _get_lock(state_path), batched_updates(state_path, StateDocument) as state:
+        state.segments[segment_id] = _with_status(
+            _require_record(state, segment_id),
+            SegmentStatus.ERROR,
+            {"error_message": error_message},
+        )
+        state.consecutive_failures += 1
+        return state.consecutive_failures
 
 
 def compute_resume_info(state: StateDocument) -> ResumeInfo:
@@ -21,6 +21,8 @@ from state.store import (
     ensure_state,
     load_segments,
     load_state,
+    mark_completed,
+    mark_failed,
     mark_status,
     reset_error_segments,
     set_consecutive_failures,
@@ -418,13 +420,13 @@ def run_translation(
                                 pass_successes += 1
                             elif result.error:
                                 logger.error("Translation failed for %s: %s", result.segment_id, result.error)
-                                mark_status(
-                                    settings.state_file,
-                                    result.segment_id,
-                                    SegmentStatus.ERROR,
-                                    error_message=str(result.error),
-                                )
                                 if isinstance(result.error, ProviderFatalError):
+                                    mark_status(
+                                        settings.state_file,
+                                        result.segment_id,
+                                        SegmentStatus.ERROR,
+                                        error_message=str(result.error),
+                                    )
                                     # Fatal means the whole run cannot succeed — a
                                     # rejected key or unusable model. Stop scheduling
                                     # instead of repeating it against every remaining
@@ -446,10 +448,11 @@ def run_translation(
                                 preview_lines[preview_index] = f"[red]{error_msg}[/red]"
                                 pass_failures.append(result.segment_id)
 
-                                # Track consecutive failures and trigger cooldown if needed
-                                trans_state = load_state(settings.state_file)
-                                consecutive = trans_state.consecutive_failures + 1
-                                set_consecutive_failures(settings.state_file, consecutive)
+                                # Record the error and count it towards the cooldown
+                                # in one state write.
+                                consecutive = mark_failed(
+                                    settings.state_file, result.segment_id, str(result.error)
+                                )
 
                                 if consecutive >= 3:
                                     in_cooldown = True
@@ -479,10 +482,10 @@ def run_translation(
                                     in_cooldown = False
                                     cooldown_remaining = ""
                             else:
-                                mark_status(
+                                # Also resets consecutive failures on any success.
+                                mark_completed(
                                     settings.state_file,
                                     result.segment_id,
-                                    SegmentStatus.COMPLETED,
                                     translation=result.translation,
                                     provider_name=result.provider_name,
                                     model_name=result.model_name,
@@ -494,8 +497,6 @@ def run_translation(
                                 text = _truncate_text(_strip_tags(result.translation))
                                 preview_lines[preview_index] = f"[green]{text}[/green]"
                                 pass_successes += 1
-                                # Reset consecutive failures on any success
-                                set_consecutive_failures(settings.state_file, 0)
 
                             # Round-robin through preview slots
                             preview_index = (preview_index + 1) % max_workers
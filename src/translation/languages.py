@@ -39,6 +39,11 @@ _LANGUAGE_MAP = {
     "korean": ("ko", "Korean"),
 }
 
+# describe_language runs for every prompt built, so invert the table once
+# instead of scanning it per call. Reversed so the first entry for a code wins,
+# as the scan did ("zh" describes as "Chinese").
+_DISPLAY_BY_CODE = {code: display for code, display in reversed(_LANGUAGE_MAP.values())}
+
 
 def normalize_language(value: str) -> tuple[str, str]:
     key = value.strip().lower()
@@ -51,7 +56,4 @@ def normalize_language(value: str) -> tuple[str, str]:
 
 
 def describe_language(code: str) -> str:
-    for stored_code, display in _LANGUAGE_MAP.values():
-        if stored_code == code:
-            return display
-    return code
+    return _DISPLAY_BY_CODE.get(code, code)
@@ -34,20 +34,28 @@ def target_is_chinese(language: str) -> bool:
     return bool(CHINESE_RE.search(language))
 
 
-def polish_state(state: StateDocument) -> StateDocument:
+def polish_state(
+    state: StateDocument, polished: dict[str, str] | None = None
+) -> StateDocument:
     """Polish all completed translations in a state document.
 
     Args:
         state: State document to polish
+        polished: Optional memo of original -> polished text; filled in as
+            translations are polished so a later pass can reuse the results
 
     Returns:
         New state document with polished translations
     """
+    memo = {} if polished is None else polished
     updated_state = state.model_copy(deep=True)
     for record in updated_state.segments.values():
         if record.status != SegmentStatus.COMPLETED or not record.translation:
             continue
-        record.translation = polish_text(record.translation)
+        text = record.translation
+        if text not in memo:
+            memo[text] = polish_translation(text)
+        record.translation = memo[text]
     return updated_state
 
 
@@ -91,7 +99,10 @@ def polish_if_chinese(
     except FileNotFoundError:
         return False
 
-    if polish_state(state).model_dump() == state.model_dump():
+    # Shared with the locked pass below, which then only polishes translations
+    # that changed in between instead of redoing the whole book.
+    polished: dict[str, str] = {}
+    if polish_state(state, polished).model_dump() == state.model_dump():
         return False
 
     prefix = f"{message_prefix} " if message_prefix else ""
@@ -102,7 +113,9 @@ def polish_if_chinese(
     # the write below was overwritten by the stale snapshot.
     from state.store import update_state_atomic
 
-    changed = update_state_atomic(state_file_path, polish_state)
+    changed = update_state_atomic(
+        state_file_path, lambda current: polish_state(current, polished)
+    )
     if changed:
         console_print("[green]Formatting complete.[/green]")
     return changed
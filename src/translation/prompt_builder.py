@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from textwrap import dedent
 
 from state.models import ExtractMode, Segment
@@ -41,9 +42,25 @@ def build_prompt(segment: Segment, source_language: str, target_language: str) -
     Returns:
         Complete prompt with system instructions and source content
     """
+    intro = _prompt_intro(
+        source_language, target_language, segment.extract_mode, _PROMPT_PREAMBLE
+    )
+    return f"{intro}\n\nSOURCE:\n{segment.source_content}"
+
+
+# The intro depends only on the language pair, extract mode and preamble, so
+# it is built once per run rather than once per segment. The preamble is part
+# of the key so configure_prompt takes effect immediately.
+@lru_cache(maxsize=32)
+def _prompt_intro(
+    source_language: str,
+    target_language: str,
+    extract_mode: ExtractMode,
+    preamble: str | None,
+) -> str:
     mode_instruction = (
         "Preserve HTML structure in the translation."
-        if segment.extract_mode == ExtractMode.HTML
+        if extract_mode == ExtractMode.HTML
         else "Return a faithful translation of the prose without adding explanations."
     )
     display_source = describe_language(source_language)
@@ -57,22 +74,19 @@ def build_prompt(segment: Segment, source_language: str, target_language: str) -
         language_instruction = f"Translate from {display_source} into {display_target}."
 
     # Use custom prompt if configured, otherwise use default
-    if _PROMPT_PREAMBLE:
+    if preamble:
         # {language_instruction} is documented as an available placeholder in both
         # README.md and config.example.yaml, but was never passed here, so any
         # custom prompt_preamble using it failed with KeyError.
-        intro = dedent(
-            _PROMPT_PREAMBLE.format(
+        return dedent(
+            preamble.format(
                 source_language=display_source,
                 target_language=display_target,
                 mode_instruction=mode_instruction,
                 language_instruction=language_instruction,
             )
         ).strip()
-    else:
-        intro = DEFAULT_SYSTEM_PROMPT.format(
-            language_instruction=language_instruction,
-            mode_instruction=mode_instruction,
-        ).strip()
-
-    return f"{intro}\n\nSOURCE:\n{segment.source_content}"
+    return DEFAULT_SYSTEM_PROMPT.format(
+        language_instruction=language_instruction,
+        mode_instruction=mode_instruction,
+    ).strip()
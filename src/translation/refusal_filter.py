@@ -69,7 +69,13 @@ def looks_like_refusal(text: str | None, *, max_length: int = 400) -> bool:
     if not stripped:
         return False
 
-    normalised = _normalise(stripped)
+    # Only the opening window is inspected, so normalise a slice rather than a
+    # whole chapter-length translation. Collapsing whitespace can shrink the
+    # slice below the window, and only then is the full text needed.
+    raw_window = stripped[: 2 * max_length]
+    normalised = _normalise(raw_window)
+    if len(normalised) <= max_length and len(raw_window) < len(stripped):
+        normalised = _normalise(stripped)
     prefix_window = normalised[:max_length]
 
     if prefix_window.startswith(_DIRECT_REFUSALS):
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+import re
+import threading
+from collections.abc import Callable, Sequence
+from functools import lru_cache
 from pathlib import Path
-from posixpath import normpath
 
-from lxml import html
+from lxml import etree, html
 
 MEDIA_ATTRS: list[tuple[str, Sequence[str]]] = [
     ("img", ("src", "srcset")),
@@ -20,36 +22,79 @@ MEDIA_ATTRS: list[tuple[str, Sequence[str]]] = [
 
 
 #: Schemes that must be left untouched rather than rewritten to a content path.
-_EXTERNAL_PREFIXES = (
-    "data:",
-    "http:",
-    "https:",
-    "//",
-    "#",
-    "mailto:",
-    "tel:",
-    "ftp:",
-    "file:",
-    "blob:",
-)
+_EXTERNAL_SCHEMES = frozenset({"data", "http", "https", "mailto", "tel", "ftp", "file", "blob"})
+
+#: Scheme-less prefixes that are likewise not book-relative paths.
+_EXTERNAL_PREFIXES = ("//", "#")
 
 
 def _is_external_url(value: str) -> bool:
     # URL schemes are case-insensitive; the check was case-sensitive and covered
     # only four prefixes, so "HTTPS://…" and mailto:/tel: links were treated as
-    # relative and rewritten into a broken content/ path.
-    return value.strip().lower().startswith(_EXTERNAL_PREFIXES)
+    # relative and rewritten into a broken content/ path. Only the scheme is
+    # lowercased: lowering the whole value copied every data: payload.
+    value = value.strip()
+    if value.startswith(_EXTERNAL_PREFIXES):
+        return True
+    scheme, sep, _ = value.partition(":")
+    return bool(sep) and scheme.lower() in _EXTERNAL_SCHEMES
+
+
+def _needs_normalising(path: str) -> bool:
+    """Whether *path* has dot or empty segments, or a trailing slash, to collapse.
+
+    Most media URLs are already clean ("images/fig1.png"), so they skip the walk.
+    """
+    return path.startswith(".") or "/." in path or "//" in path or path.endswith("/")
+
+
+def _normalise_segments(path: str) -> str:
+    """Collapse dot and empty segments of a "/"-separated path.
+
+    Equivalent to posixpath.normpath for the paths built here, but a single
+    stack walk without its general-purpose branching.
+    """
+    root = "/" if path.startswith("/") else ""
+    parts: list[str] = []
+    for segment in path.split("/"):
+        if not segment or segment == ".":
+            continue
+        if segment == "..":
+            if parts and parts[-1] != "..":
+                parts.pop()
+            elif not root:
+                parts.append(segment)
+            continue
+        parts.append(segment)
+    return root + "/".join(parts) or "."
 
 
-def _prefix_content_path(relative_to: Path, url: str) -> str:
-    if not url or _is_external_url(url):
-        return url
-    if url.startswith("content/"):
-        return url
+def _content_path_resolver(relative_to: Path) -> Callable[[str], str]:
+    """Return a rewriter mapping URLs relative to *relative_to* into content/.
+
+    The base directory is computed once per document.
+    """
     base = relative_to.parent.as_posix()
+
+    def resolve(url: str) -> str:
+        # Checked before the cache: a data: URI can run to megabytes and must
+        # not be kept alive as a cache key.
+        if not url or _is_external_url(url) or url.startswith("content/"):
+            return url
+        return _content_url(base, url)
+
+    return resolve
+
+
+# Memoised across documents rather than per document: chapters sharing a
+# directory repeat the same stylesheet, image and cross-chapter URLs, and the
+# result depends only on these two strings.
+@lru_cache(maxsize=8192)
+def _content_url(base: str, url: str) -> str:
     combined = f"{base}/{url}" if base else url
-    normalised = normpath(combined)
-    return f"content/{normalised}"
+    if _needs_normalising(combined):
+        combined = _normalise_segments(combined)
+    return f"content/{combined}"
 
 
 #: Schemes that execute code when followed. A book is untrusted input, and the
@@ -105,7 +150,7 @@ def _sanitise_urls(doc: html.HtmlElement) -> None:
                 del el.attrib[attr]
 
 
-def _rewrite_links(doc: html.HtmlElement, relative_path: Path) -> None:
+def _rewrite_links(doc: html.HtmlElement, resolve: Callable[[str], str]) -> None:
     for el in doc.xpath(".//a[@href]"):
         href = el.get("href")
         if not href:
@@ -120,7 +165,7 @@ def _rewrite_links(doc: html.HtmlElement, relative_path: Path) -> None:
             path_part, fragment = href.split("#", 1)
         if not path_part:
             continue
-        resolved = _prefix_content_path(relative_path, path_part)
+        resolved = resolve(path_part)
         if resolved == path_part:
             continue
         if fragment:
@@ -129,72 +174,51 @@ def _rewrite_links(doc: html.HtmlElement, relative_path: Path) -> None:
             el.set("href", resolved)
 
 
-def _split_srcset(value: str) -> list[str]:
-    """Split a srcset on candidate boundaries, not on every comma.
+#: One srcset image candidate: a URL followed by optional descriptors. A URL is
+#: a run of non-whitespace, so commas inside it (a data: payload) stay part of
+#: it; only commas that trail it are separators, as in the HTML spec's parser.
+_SRCSET_RE = re.compile(r"([^\s,]\S*?)(?=,*(?:\s|$))(\s+[^,]*)?")
 
-    A data: URL's payload may itself contain commas, so a plain split(",")
-    shredded such entries into fragments. Commas inside a data: URL are only
-    separators once whitespace follows them.
+
+def _rewrite_srcset(value: str, resolve: Callable[[str], str]) -> str:
+    """Rewrite each candidate URL of a srcset in place.
+
+    Separators and descriptors are kept verbatim, so no per-candidate
+    split/strip/join is needed.
     """
-    candidates: list[str] = []
-    current: list[str] = []
-    in_data_url = False
-    index = 0
-    while index < len(value):
-        char = value[index]
-        if not in_data_url and "".join(current).strip().lower().endswith("data:") is False:
-            # Detect entry into a data: URL by looking at the token so far.
-            token = "".join(current).lstrip()
-            if token.lower().startswith("data:"):
-                in_data_url = True
-        if char == "," and (not in_data_url or value[index + 1 : index + 2].isspace()):
-            candidates.append("".join(current))
-            current = []
-            in_data_url = False
-        else:
-            current.append(char)
-        index += 1
-    if current:
-        candidates.append("".join(current))
-    return candidates
-
-
-def _rewrite_media_urls(doc: html.HtmlElement, relative_path: Path) -> None:
-    for tag, attrs in MEDIA_ATTRS:
-        for el in doc.xpath(f".//{tag}"):
-            for attr in attrs:
-                value = el.get(attr)
-                if value is None and attr.startswith("{"):
-                    _, local = attr.rsplit("}", 1)
-                    value = el.get(local)
-                if value is None and ":" in attr:
-                    _, local = attr.rsplit(":", 1)
-                    value = el.get(local)
-                if value is None:
-                    value = el.attrib.get(attr)
-                if not value:
-                    continue
-                if attr == "srcset":
-                    parts: list[str] = []
-                    for candidate in _split_srcset(value):
-                        candidate = candidate.strip()
-                        if not candidate:
-                            continue
-                        if " " in candidate:
-                            url_part, descriptor = candidate.split(" ", 1)
-                            parts.append(
-                                f"{_prefix_content_path(relative_path, url_part)} {descriptor.strip()}"
-                            )
-                        else:
-                            parts.append(_prefix_content_path(relative_path, candidate))
-                    if parts:
-                        el.set(attr, ", ".join(parts))
-                else:
-                    el.set(attr, _prefix_content_path(relative_path, value))
-
-
-REMOVABLE_TAGS = {"font", "center"}
-REMOVABLE_ATTRS = {"style", "class", "lang", "xml:lang"}
+    return _SRCSET_RE.sub(
+        lambda m: resolve(m.group(1)) + (m.group(2) or ""),
+        value,
+    )
+
+
+_MEDIA_ATTRS_BY_TAG = dict(MEDIA_ATTRS)
+
+
+def _rewrite_media_urls(doc: html.HtmlElement, resolve: Callable[[str], str]) -> None:
+    # One walk over the tree for every media tag, instead of one XPath query
+    # (and one full traversal) per tag.
+    for el in doc.iter(*_MEDIA_ATTRS_BY_TAG):
+        for attr in _MEDIA_ATTRS_BY_TAG[el.tag]:
+            value = el.get(attr)
+            if value is None and attr.startswith("{"):
+                _, local = attr.rsplit("}", 1)
+                value = el.get(local)
+            if value is None and ":" in attr:
+                _, local = attr.rsplit(":", 1)
+                value = el.get(local)
+            if value is None:
+                value = el.attrib.get(attr)
+            if not value:
+                continue
+            if attr == "srcset":
+                el.set(attr, _rewrite_srcset(value, resolve))
+            else:
+                el.set(attr, resolve(value))
+
+
+REMOVABLE_TAGS = frozenset({"font", "center"})
+REMOVABLE_ATTRS = frozenset({"style", "class", "lang", "xml:lang"})
 
 #: Elements dropped with their contents. The book is untrusted input and the
 #: export is opened in a browser, but none of these were removed, so a book
@@ -211,67 +235,80 @@ UNSAFE_TAGS = (
 
 def _remove_tags(doc: html.HtmlElement) -> None:
     # Whole subtree, not drop_tag: drop_tag keeps the element's text, which for a
-    # <script> would leave the source code inline in the page.
-    for tag in UNSAFE_TAGS:
-        for el in doc.xpath(f".//{tag}"):
-            parent = el.getparent()
-            if parent is not None:
-                el.drop_tree()
-
-    for tag in REMOVABLE_TAGS:
-        for el in doc.xpath(f".//{tag}"):
-            el.drop_tag()
+    # <script> would leave the source code inline in the page. The tail is
+    # ordinary content following the element and is kept.
+    etree.strip_elements(doc, *UNSAFE_TAGS, with_tail=False)
+    # lxml's C helpers unwrap every match in one call, rather than one Python
+    # drop_tag()/drop_tree() per element.
+    etree.strip_tags(doc, *REMOVABLE_TAGS)
 
 
 def _strip_attributes(doc: html.HtmlElement) -> None:
+    etree.strip_attributes(doc, *REMOVABLE_ATTRS)
     # `.//*` excludes the root element, so attributes on it survived stripping.
     for el in doc.iter():
         if not isinstance(el.tag, str):
             continue
 
         # Inline event handlers execute on load or interaction; none were removed.
+        # They are matched by prefix, which strip_attributes cannot express.
         for name in [a for a in el.attrib if a.lower().startswith("on")]:
             del el.attrib[name]
 
-        for attr in REMOVABLE_ATTRS:
-            if attr not in el.attrib:
-                continue
-            if attr in ("class", "style") and el.get("data-lang"):
-                # Preserve class/style on translation/original nodes if present
-                del el.attrib[attr]
-                continue
-            el.attrib.pop(attr, None)
-
 
 def _normalise_images(doc: html.HtmlElement) -> None:
-    for img in doc.xpath(".//img"):
-        if "loading" not in img.attrib:
-            img.attrib["loading"] = "lazy"
-        if "decoding" not in img.attrib:
-            img.attrib["decoding"] = "async"
-        # Ensure images don't overflow
-        classes = [cls for cls in img.attrib.get("class", "").split() if cls]
+    for img in doc.iter("img"):
+        attrib = img.attrib
+        if "loading" not in attrib:
+            img.set("loading", "lazy")
+        if "decoding" not in attrib:
+            img.set("decoding", "async")
+        # Ensure images don't overflow. class has normally been stripped already,
+        # so only split and rejoin in the rare case one is still present.
+        existing = attrib.get("class")
+        if existing is None:
+            img.set("class", "tepub-img")
+            continue
+        classes = existing.split()
         if "tepub-img" not in classes:
             classes.append("tepub-img")
-        if classes:
-            img.attrib["class"] = " ".join(classes)
-        else:
-            img.attrib.pop("class", None)
+        img.set("class", " ".join(classes))
 
 
-def clean_html(content: bytes | str, *, relative_path: Path | None = None) -> str:
-    parser = html.HTMLParser(encoding="utf-8")
-    doc = html.fromstring(content, parser=parser)
+#: One parser per thread: constructing an lxml parser allocates its libxml2
+#: context, and clean_html runs for every document in the book, but a parser
+#: must not be used by two threads at once and these functions are public.
+_PARSERS = threading.local()
+
+
+def _parser() -> html.HTMLParser:
+    parser = getattr(_PARSERS, "parser", None)
+    if parser is None:
+        parser = _PARSERS.parser = html.HTMLParser(encoding="utf-8")
+    return parser
+
+
+def clean_document(
+    content: bytes | str, *, relative_path: Path | None = None
+) -> html.HtmlElement:
+    """Parse and clean *content*, returning the tree rather than markup."""
+    doc = html.fromstring(content, parser=_parser())
     _remove_tags(doc)
     _sanitise_urls(doc)
     _strip_attributes(doc)
     _normalise_images(doc)
     if relative_path is not None:
-        _rewrite_media_urls(doc, relative_path)
-        _rewrite_links(doc, relative_path)
-    return html.tostring(doc, encoding="unicode", method="html")
+        resolve = _content_path_resolver(relative_path)
+        _rewrite_media_urls(doc, resolve)
+        _rewrite_links(doc, resolve)
+    return doc
+
+
+def serialise_html(doc: html.HtmlElement) -> bytes:
+    """Serialise straight to UTF-8, ready to write to disk without re-encoding."""
+    return html.tostring(doc, encoding="utf-8", method="html")
 
 
-def ensure_parseable(content: str) -> None:
-    # Raises if not well-formed
-    html.fromstring(content)
+def clean_html(content: bytes | str, *, relative_path: Path | None = None) -> str:
+    doc = clean_document(content, relative_path=relative_path)
+    return html.tostring(doc, encoding="unicode", method="html")
@@ -4,7 +4,6 @@ import shutil
 from pathlib import Path, PurePosixPath
 
 from ebooklib import ITEM_DOCUMENT, epub
-from lxml import html as lxml_html
 
 from config import AppSettings
 from epub_io.path_utils import safe_relative_member
@@ -13,7 +12,7 @@ from epub_io.resources import iter_spine_items
 from injection.engine import apply_translations
 
 from .assets import BookData, copy_static_assets, render_index
-from .dom import clean_html, ensure_parseable
+from .dom import clean_document, serialise_html
 
 
 def _default_output_dir(epub_path: Path, work_dir: Path) -> Path:
@@ -29,16 +28,14 @@ def _book_title(reader: EpubReader) -> str:
 
 
 def _document_title(tree) -> str:
-    candidates = tree.xpath("//h1")
-    if candidates:
-        text = candidates[0].text_content().strip()
-        if text:
-            return text
-    titles = tree.xpath("//title")
-    if titles:
-        text = titles[0].text_content().strip()
-        if text:
-            return text
+    # Only the first match is used, so stop at it instead of collecting every
+    # h1 in the chapter.
+    for tag in ("h1", "title"):
+        element = next(tree.iter(tag), None)
+        if element is not None:
+            text = element.text_content().strip()
+            if text:
+                return text
     return ""
 
 
@@ -85,7 +82,15 @@ def _parse_toc(entries) -> list[dict]:
     return toc_list
 
 
-def _copy_static_resources(reader: EpubReader, content_dir: Path) -> None:
+def _ensure_parent(dest: Path, created: set[Path]) -> None:
+    """Create dest's directory once per export rather than once per file."""
+    parent = dest.parent
+    if parent not in created:
+        parent.mkdir(parents=True, exist_ok=True)
+        created.add(parent)
+
+
+def _copy_static_resources(reader: EpubReader, content_dir: Path, created: set[Path]) -> None:
     for item in reader.book.get_items():
         # Skip HTML documents; they are handled separately
         if item.get_type() == ITEM_DOCUMENT:
@@ -95,7 +100,7 @@ def _copy_static_resources(reader: EpubReader, content_dir: Path) -> None:
         # entirely for an absolute name, and ".." walks upward.
         member = safe_relative_member(item.file_name, reader.epub_path)
         dest = content_dir / Path(*member.parts)
-        dest.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_parent(dest, created)
         dest.write_bytes(item.get_content())
 
 
@@ -132,18 +137,19 @@ def export_web(
     doc_titles: dict[Path, str] = {}
     documents: dict[str, str] = {}
     content_dir = output_root / "content"
+    created_dirs: set[Path] = set()
     for document in reader.iter_documents():
         path = document.path
-        if path in updated_html:
-            content = clean_html(updated_html[path], relative_path=path)
-        else:
-            content = clean_html(document.raw_html, relative_path=path)
-        ensure_parseable(content)
+        source = updated_html[path] if path in updated_html else document.raw_html
+        # Serialise once to UTF-8 bytes for the file; the str copy is only for
+        # the index page's embedded book data.
+        cleaned = clean_document(source, relative_path=path)
+        payload = serialise_html(cleaned)
+        content = payload.decode("utf-8")
         if mode == "translated_only":
-            # lxml_html is imported unconditionally, so the old `in globals()`
-            # guard was always true and its else branch unreachable. Titles come
-            # from the *cleaned* content here so they reflect the translation.
-            doc_titles[path] = _document_title(lxml_html.fromstring(content)) or path.stem
+            # Titles come from the *cleaned* tree here so they reflect the
+            # translation; it is already in hand, so nothing is reparsed.
+            doc_titles[path] = _document_title(cleaned) or path.stem
         else:
             doc_titles[path] = _document_title(document.tree) or path.stem
         documents[path.as_posix()] = content
@@ -152,10 +158,10 @@ def export_web(
         # document named "../escape.xhtml" still wrote outside content_dir.
         doc_member = safe_relative_member(path.as_posix(), reader.epub_path)
         dest = content_dir / Path(*doc_member.parts)
-        dest.parent.mkdir(parents=True, exist_ok=True)
-        dest.write_text(content, encoding="utf-8")
+        _ensure_parent(dest, created_dirs)
+        dest.write_bytes(payload)
 
-    _copy_static_resources(reader, content_dir)
+    _copy_static_resources(reader, content_dir, created_dirs)
 
     spine = _build_spine(reader, doc_titles)
     toc = _parse_toc(reader.book.toc) if reader.book.toc else []
@@ -165,7 +171,9 @@ def export_web(
         for entry in toc:
             href = str(entry.get("href", ""))
             path_part, _, fragment = href.partition("#")
-            updates = title_updates.get(PurePosixPath(path_part))
+            updates = title_updates.get(path_part)
+            if updates is None:
+                updates = title_updates.get(str(PurePosixPath(path_part)))
             if not updates:
                 continue
             translated = updates.get(fragment or None) or updates.get(None)
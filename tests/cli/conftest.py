@@ -0,0 +1,82 @@
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from config import AppSettings
+from state.models import ExtractMode, Segment, SegmentMetadata, SegmentsDocument
+
+
+@pytest.fixture(autouse=True)
+def _isolated_work_root(monkeypatch, tmp_path) -> None:
+    # Keep every CLI invocation out of the real ~/.tepub; tests that need a
+    # different root override it with their own setenv.
+    monkeypatch.setenv("TEPUB_WORK_ROOT", str(tmp_path / ".tepub"))
+
+
+@pytest.fixture(scope="session")
+def runner() -> CliRunner:
+    # Each invoke() runs in its own isolated context, so one runner is safe to share.
+    return CliRunner()
+
+
+_CHAPTER_PATH = Path("chapter.xhtml")
+
+
+def _build_segment(segment_id: str, content: str) -> Segment:
+    # Inputs are test-controlled, so skip validation.
+    return Segment.model_construct(
+        segment_id=segment_id,
+        file_path=_CHAPTER_PATH,
+        xpath="/html/body/p[1]",
+        extract_mode=ExtractMode.TEXT,
+        source_content=content,
+        metadata=SegmentMetadata.model_construct(
+            element_type="p", spine_index=0, order_in_file=0
+        ),
+    )
+
+
+@pytest.fixture(scope="module")
+def segments_json() -> bytes:
+    """A segments.json payload, serialised once per module and written per test."""
+    document = SegmentsDocument(
+        epub_path=Path("book.epub"),
+        generated_at="2025-09-27T00:00:00Z",
+        segments=[_build_segment("seg-1", "1"), _build_segment("seg-2", "正常内容")],
+    )
+    return document.model_dump_json(indent=2).encode("utf-8")
+
+
+@pytest.fixture
+def settings(tmp_path) -> AppSettings:
+    """Settings for a workspace under tmp_path, with its directory created."""
+    workspace = tmp_path / "workspace"
+    # Inputs are test-controlled, so skip validation.
+    built = AppSettings.model_construct(work_root=workspace, work_dir=workspace)
+    workspace.mkdir(parents=True, exist_ok=True)
+    return built
+
+
+@pytest.fixture(scope="session")
+def _stub_epub_source(tmp_path_factory) -> Path:
+    path = tmp_path_factory.mktemp("stub") / "book.epub"
+    path.write_bytes(b"stub")
+    return path
+
+
+@pytest.fixture
+def stub_epub(_stub_epub_source, tmp_path) -> Path:
+    """A placeholder book.epub in tmp_path for commands that only check it exists.
+
+    Hard-linked from one shared file; tests must not write to it.
+    """
+    target = tmp_path / "book.epub"
+    try:
+        os.link(_stub_epub_source, target)
+    except OSError:
+        # Hard links are unavailable on some filesystems.
+        shutil.copyfile(_stub_epub_source, target)
+    return target
@@ -1,28 +1,16 @@
 from __future__ import annotations
 
-from importlib import import_module
+from unittest.mock import MagicMock
 
-from click.testing import CliRunner
+from cli.main import app
 
 
-def _load_app():
-    return import_module("cli.main").app
+def test_debug_analyze_skips_invokes_analysis(monkeypatch, tmp_path, runner) -> None:
+    fake_analyze = MagicMock()
+    monkeypatch.setattr("debug_tools.analysis.analyze_library", fake_analyze)
 
-
-def test_debug_analyze_skips_invokes_analysis(monkeypatch, tmp_path) -> None:
-    called = {}
-
-    def _fake_analyze(settings, library, limit, top_n, report_path):
-        called["library"] = library
-        called["limit"] = limit
-        called["top_n"] = top_n
-        called["report"] = report_path
-
-    monkeypatch.setattr("debug_tools.analysis.analyze_library", _fake_analyze)
-
-    runner = CliRunner()
     result = runner.invoke(
-        _load_app(),
+        app,
         [
             "debug",
             "analyze-skips",
@@ -33,9 +21,12 @@ def test_debug_analyze_skips_invokes_analysis(monkeypatch, tmp_path) -> None:
             "--top-n",
             "3",
         ],
+        catch_exceptions=False,
     )
 
     assert result.exit_code == 0
-    assert called["library"] == tmp_path
-    assert called["limit"] == 5
-    assert called["top_n"] == 3
+    fake_analyze.assert_called_once()
+    _settings, library = fake_analyze.call_args.args
+    assert library == tmp_path
+    assert fake_analyze.call_args.kwargs["limit"] == 5
+    assert fake_analyze.call_args.kwargs["top_n"] == 3
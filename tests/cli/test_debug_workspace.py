@@ -1,27 +1,20 @@
 from __future__ import annotations
 
-from importlib import import_module
-
-from click.testing import CliRunner
-
+from cli.main import app
 from config import models as config_models
 
 
-def _load_app():
-    return import_module("cli.main").app
-
-
-def test_debug_workspace_command(monkeypatch, tmp_path) -> None:
+def test_debug_workspace_command(tmp_path, runner) -> None:
     original_root = config_models.DEFAULT_ROOT_DIR
     config_models.DEFAULT_ROOT_DIR = tmp_path / ".tepub"
-    monkeypatch.setenv("TEPUB_WORK_ROOT", str(tmp_path / ".tepub"))
 
     epub_path = tmp_path / "Sample Book.epub"
     epub_path.touch()
 
     try:
-        runner = CliRunner()
-        result = runner.invoke(_load_app(), ["debug", "workspace", str(epub_path)])
+        result = runner.invoke(
+            app, ["debug", "workspace", str(epub_path)], catch_exceptions=False
+        )
 
         # with_book_workspace() derives workspace from EPUB filename (stem)
         # Expected: "Sample Book" (not slugified "sample-55c5211f")
@@ -34,14 +27,17 @@ def test_debug_workspace_command(monkeypatch, tmp_path) -> None:
         config_models.DEFAULT_ROOT_DIR = original_root
 
 
-def test_debug_workspace_respects_cli_override(monkeypatch, tmp_path) -> None:
+def test_debug_workspace_respects_cli_override(monkeypatch, tmp_path, runner) -> None:
     epub_path = tmp_path / "Another.epub"
     epub_path.touch()
     override_root = tmp_path / "custom_root"
     monkeypatch.setenv("TEPUB_WORK_ROOT", str(override_root))
 
-    runner = CliRunner()
-    result = runner.invoke(_load_app(), ["--work-dir", str(override_root), "debug", "workspace", str(epub_path)])
+    result = runner.invoke(
+        app,
+        ["--work-dir", str(override_root), "debug", "workspace", str(epub_path)],
+        catch_exceptions=False,
+    )
 
     # --work-dir must place the workspace under the given root. This previously
     # asserted the workspace appeared next to the EPUB instead, which is what the
@@ -1,15 +1,9 @@
-
-from click.testing import CliRunner
-
 from cli.main import app
-from config import AppSettings
 from state.models import SegmentStatus, StateDocument, TranslationRecord
 from state.store import save_state
 
 
-def test_format_command_polishes_translations(tmp_path, monkeypatch):
-    settings = AppSettings().model_copy(update={"work_dir": tmp_path, "target_language": "Simplified Chinese"})
-    settings.ensure_directories()
+def test_format_command_polishes_translations(runner, settings):
     state_path = settings.state_file
     state = StateDocument(
         segments={
@@ -24,8 +18,9 @@ def test_format_command_polishes_translations(tmp_path, monkeypatch):
     )
     save_state(state, state_path)
 
-    runner = CliRunner()
-    result = runner.invoke(app, ["--work-dir", str(tmp_path), "format"])
+    result = runner.invoke(
+        app, ["--work-dir", str(settings.work_dir), "format"], catch_exceptions=False
+    )
 
     assert result.exit_code == 0
     assert "Formatted translations saved" in result.output
@@ -0,0 +1,82 @@
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cli.main import app
+
+
+@contextmanager
+def _patched_pipeline(calls: list):
+    """Replace every stage the pipeline drives with a recorder."""
+
+    def _fake_extraction(settings, input_epub):
+        calls.append(("extract", input_epub))
+
+    def _fake_translation(settings, input_epub, source_language, target_language):
+        calls.append(("translate", target_language))
+
+    def _fake_export_web(settings, input_epub, output_mode=None):
+        calls.append(("web", output_mode))
+        return settings.work_dir / "web"
+
+    def _fake_injection(settings, input_epub, output_epub, mode):
+        calls.append(("inject", output_epub, mode))
+        return {Path("chapter.xhtml"): b"<html/>"}, {}
+
+    with ExitStack() as stack:
+        stack.enter_context(
+            patch.multiple(
+                "cli.commands.pipeline",
+                run_extraction=_fake_extraction,
+                run_translation=_fake_translation,
+            )
+        )
+        stack.enter_context(
+            patch.multiple(
+                "cli.commands.export",
+                export_web=_fake_export_web,
+                create_web_archive=lambda path: path,
+                run_injection=_fake_injection,
+            )
+        )
+        yield
+
+
+@pytest.mark.parametrize(
+    "args,expect_web,expect_epub",
+    [
+        ([], True, True),
+        (["--web"], True, False),
+        (["--epub"], False, True),
+    ],
+)
+def test_pipeline_runs_selected_exports(
+    tmp_path, runner, stub_epub, args, expect_web, expect_epub
+):
+    calls: list = []
+    work_root = tmp_path / "work"
+
+    with _patched_pipeline(calls):
+        result = runner.invoke(
+            app,
+            ["--work-dir", str(work_root), "pipeline", str(stub_epub), "--to", "zh", *args],
+            catch_exceptions=False,
+        )
+
+    assert result.exit_code == 0, result.output
+    stages = [call[0] for call in calls]
+    assert stages[:2] == ["extract", "translate"]
+    assert ("web" in stages) is expect_web
+    injections = [call for call in calls if call[0] == "inject"]
+    if expect_epub:
+        work_dir = injections[0][1].parent
+        stem, suffix = stub_epub.stem, stub_epub.suffix
+        expected = [
+            (work_dir / f"{stem}_bilingual{suffix}", "bilingual"),
+            (work_dir / f"{stem}_translated{suffix}", "translated_only"),
+        ]
+        assert [(call[1], call[2]) for call in injections] == expected
+    else:
+        assert injections == []
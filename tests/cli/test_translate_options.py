@@ -0,0 +1,34 @@
+import importlib
+
+from cli.commands.translate import translate
+
+# cli.commands re-exports the command under the module's own name, so the
+# dotted-path form of monkeypatch would resolve to the Command object.
+translate_module = importlib.import_module("cli.commands.translate")
+
+
+def test_translate_uses_language_flags(monkeypatch, runner, settings, stub_epub):
+    calls: list = []
+    monkeypatch.setattr(type(settings), "validate_for_translation", lambda self, epub: None)
+    monkeypatch.setattr(
+        translate_module, "run_translation", lambda **kwargs: calls.append(kwargs)
+    )
+
+    # Invoke the command itself rather than the top-level group: the group only
+    # loads settings, which the fixture already provides, and standalone_mode
+    # off skips Click's exit and error formatting.
+    result = runner.invoke(
+        translate,
+        [str(stub_epub), "--from", "English", "--to", "Japanese"],
+        obj={"settings": settings, "work_dir_overridden": True},
+        standalone_mode=False,
+        catch_exceptions=False,
+    )
+
+    assert result.exit_code == 0, result.output
+    [call] = calls
+    assert call["source_language"] == "en"
+    assert call["target_language"] == "ja"
+    assert call["settings"].source_language == "English"
+    assert call["settings"].target_language == "Japanese"
+    assert call["settings"].work_dir == settings.work_dir
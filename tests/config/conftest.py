@@ -0,0 +1,33 @@
+import json
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def valid_workspace(tmp_path_factory):
+    """A fake EPUB with matching segments.json and state.json.
+
+    Validation only reads these files, so one copy serves every test that needs
+    a complete workspace instead of each rebuilding it in its own tmp_path.
+    """
+    root = tmp_path_factory.mktemp("valid-workspace")
+    epub_path = root / "book.epub"
+    epub_path.write_text("fake epub")
+
+    work_dir = root / "workspace"
+    work_dir.mkdir()
+    segments_data = {
+        "epub_path": str(epub_path),
+        "generated_at": "2024-01-01T00:00:00",
+        "segments": [],
+    }
+    (work_dir / "segments.json").write_text(json.dumps(segments_data))
+    state_data = {
+        "provider_name": "test",
+        "model_name": "test-model",
+        "source_language": "en",
+        "target_language": "zh",
+        "segments": {},
+    }
+    (work_dir / "state.json").write_text(json.dumps(state_data))
+    return epub_path, work_dir
@@ -40,32 +40,9 @@ def test_cli_config_file_overrides_env(monkeypatch, tmp_path, tmp_path_factory)
 class TestAppSettingsValidation:
     """Tests for AppSettings validation methods."""
 
-    def test_validate_for_export_succeeds_when_all_files_exist(self, tmp_path):
+    def test_validate_for_export_succeeds_when_all_files_exist(self, valid_workspace):
         """Test validation passes when all required files exist."""
-        import json
-        epub_path = tmp_path / "book.epub"
-        epub_path.write_text("fake epub")
-
-        work_dir = tmp_path / "workspace"
-        work_dir.mkdir()
-
-        # Create valid segments file
-        segments_data = {
-            "epub_path": str(epub_path),
-            "generated_at": "2024-01-01T00:00:00",
-            "segments": []
-        }
-        (work_dir / "segments.json").write_text(json.dumps(segments_data))
-
-        # Create valid state file
-        state_data = {
-            "provider_name": "test",
-            "model_name": "test-model",
-            "source_language": "en",
-            "target_language": "zh",
-            "segments": {}
-        }
-        (work_dir / "state.json").write_text(json.dumps(state_data))
+        epub_path, work_dir = valid_workspace
 
         settings = AppSettings(
             work_dir=work_dir,
@@ -137,22 +114,9 @@ class TestAppSettingsValidation:
         assert exc_info.value.state_type == "translation"
         assert exc_info.value.epub_path == epub_path
 
-    def test_validate_for_translation_succeeds_when_segments_exist(self, tmp_path):
+    def test_validate_for_translation_succeeds_when_segments_exist(self, valid_workspace):
         """Test translation validation passes when segments file exists."""
-        import json
-        epub_path = tmp_path / "book.epub"
-        epub_path.write_text("fake epub")
-
-        work_dir = tmp_path / "workspace"
-        work_dir.mkdir()
-
-        # Create valid segments file
-        segments_data = {
-            "epub_path": str(epub_path),
-            "generated_at": "2024-01-01T00:00:00",
-            "segments": []
-        }
-        (work_dir / "segments.json").write_text(json.dumps(segments_data))
+        epub_path, work_dir = valid_workspace
 
         settings = AppSettings(
             work_dir=work_dir,
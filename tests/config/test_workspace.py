@@ -70,11 +70,44 @@ def test_with_override_root_detects_existing_workspace(tmp_path: Path) -> None:
 def test_with_override_root_accepts_matching_name_without_files(tmp_path: Path) -> None:
     settings = AppSettings(work_root=tmp_path, work_dir=tmp_path)
     epub_path = tmp_path / "The Book.epub"
-    workspace = tmp_path / build_workspace_name(epub_path)
+    workspace_name = build_workspace_name(epub_path)
+    workspace = tmp_path / workspace_name
 
     derived = settings.with_override_root(workspace, epub_path)
 
     # Since workspace doesn't have segments.json or state.json, it creates a hash-based subdir
-    expected_dir = workspace / build_workspace_name(epub_path)
+    expected_dir = workspace / workspace_name
     assert derived.work_dir == expected_dir
     assert derived.work_root == workspace
+
+
+def test_with_override_root_reuses_existing_sha1_workspace(tmp_path: Path) -> None:
+    """A workspace named by the original SHA-1 scheme keeps being found."""
+    settings = AppSettings(work_root=tmp_path, work_dir=tmp_path)
+    epub_path = tmp_path / "The Book.epub"
+    digest = hashlib.sha1(str(epub_path.resolve()).encode("utf-8")).hexdigest()[:8]
+    existing = tmp_path / f"the-{digest}"
+    existing.mkdir()
+    (existing / "state.json").touch()
+
+    derived = settings.with_override_root(tmp_path, epub_path)
+
+    assert build_workspace_name(epub_path) == existing.name
+    assert derived.work_dir == existing
+
+
+def test_build_workspace_name_follows_cwd_for_relative_paths(
+    tmp_path: Path, monkeypatch
+) -> None:
+    first = tmp_path / "a"
+    second = tmp_path / "b"
+    first.mkdir()
+    second.mkdir()
+    relative = Path("book.epub")
+
+    monkeypatch.chdir(first)
+    first_name = build_workspace_name(relative)
+    monkeypatch.chdir(second)
+    second_name = build_workspace_name(relative)
+
+    assert first_name != second_name
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import io
+from itertools import chain, repeat
 from pathlib import Path
 
+import pytest
 from rich.console import Console
 
 from config import AppSettings
@@ -30,13 +33,11 @@ def test_analyze_library_summarises_results(monkeypatch, tmp_path) -> None:
         SkipAnalysis(candidates=[], toc_unmatched_titles=["preface"]),
     ]
 
-    iterator = iter(responses)
+    # Further calls keep getting the last response.
+    iterator = chain(responses, repeat(responses[-1]))
 
     def _fake_analysis(_path, _settings):
-        try:
-            return next(iterator)
-        except StopIteration:
-            return responses[-1]
+        return next(iterator)
 
     monkeypatch.setattr(analysis, "analyze_skip_candidates", _fake_analysis)
 
@@ -61,12 +62,64 @@ def test_analyze_library_summarises_results(monkeypatch, tmp_path) -> None:
     monkeypatch.setattr(analysis, "Progress", DummyProgress)
 
     settings = AppSettings(work_root=tmp_path, work_dir=tmp_path)
-    test_console = Console(record=True)
+    buffer = io.StringIO()
+    test_console = Console(file=buffer, width=120)
     monkeypatch.setattr(analysis, "console", test_console)
 
     analysis.analyze_library(settings, library, limit=None, top_n=5, report_path=None)
 
-    output = test_console.export_text()
+    output = buffer.getvalue()
     assert "Skip Reasons" in output
     assert "cover" in output
     assert "Potential New" in output
+
+
+@pytest.mark.parametrize("limit", [0, -1])
+def test_analyze_library_with_no_books_after_limit(monkeypatch, tmp_path, limit) -> None:
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "book1.epub").touch()
+
+    def _unexpected(_path, _settings):
+        raise AssertionError("no book should be analysed")
+
+    monkeypatch.setattr(analysis, "analyze_skip_candidates", _unexpected)
+    buffer = io.StringIO()
+    monkeypatch.setattr(analysis, "console", Console(file=buffer, width=120))
+    settings = AppSettings(work_root=tmp_path, work_dir=tmp_path)
+
+    analysis.analyze_library(settings, library, limit=limit, top_n=5, report_path=None)
+
+    assert "Processed 0 EPUBs" in buffer.getvalue()
+
+
+def test_analyze_library_with_empty_directory(monkeypatch, tmp_path) -> None:
+    library = tmp_path / "library"
+    library.mkdir()
+    buffer = io.StringIO()
+    monkeypatch.setattr(analysis, "console", Console(file=buffer, width=120))
+    settings = AppSettings(work_root=tmp_path, work_dir=tmp_path)
+
+    analysis.analyze_library(settings, library, limit=None, top_n=5, report_path=None)
+
+    assert "No EPUB files found" in buffer.getvalue()
+
+
+def test_analyze_library_reports_failed_books(monkeypatch, tmp_path) -> None:
+    library = tmp_path / "library"
+    library.mkdir()
+    (library / "broken.epub").touch()
+
+    def _failing(_path, _settings):
+        raise ValueError("bad archive")
+
+    monkeypatch.setattr(analysis, "analyze_skip_candidates", _failing)
+    buffer = io.StringIO()
+    monkeypatch.setattr(analysis, "console", Console(file=buffer, width=120))
+    settings = AppSettings(work_root=tmp_path, work_dir=tmp_path)
+
+    analysis.analyze_library(settings, library, limit=None, top_n=5, report_path=None)
+
+    output = buffer.getvalue()
+    assert "1 errors" in output
+    assert "bad archive" in output
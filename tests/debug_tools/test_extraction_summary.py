@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 from rich.console import Console
@@ -58,12 +59,13 @@ def test_print_extraction_summary_outputs_tables(monkeypatch, tmp_path):
     )
     save_state(state, settings.state_file)
 
-    test_console = Console(record=True)
+    buffer = io.StringIO()
+    test_console = Console(file=buffer, width=120)
     monkeypatch.setattr("debug_tools.extraction_summary.console", test_console)
 
     print_extraction_summary(settings, show_samples=2)
 
-    output = test_console.export_text()
+    output = buffer.getvalue()
     assert "Extraction Summary" in output
     assert "Text/front.xhtml" in output
     assert "Pending segments" in output
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import io
 from pathlib import Path
 
 from rich.console import Console
@@ -26,7 +27,8 @@ def test_show_skip_list_displays_auto_skips(monkeypatch, tmp_path) -> None:
     )
     state = StateDocument(segments={})
 
-    test_console = Console(record=True)
+    buffer = io.StringIO()
+    test_console = Console(file=buffer, width=120)
 
     monkeypatch.setattr(skip_lists, "console", test_console)
     monkeypatch.setattr(skip_lists, "load_all_segments", lambda _settings: doc)
@@ -34,7 +36,7 @@ def test_show_skip_list_displays_auto_skips(monkeypatch, tmp_path) -> None:
 
     skip_lists.show_skip_list(settings)
 
-    output = test_console.export_text()
+    output = buffer.getvalue()
     assert "Automatically Skipped" in output
     assert "Text/front.xhtml" in output
     assert "toc" in output
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from epub_io.path_utils import normalize_epub_href
+from epub_io.path_utils import href_normalizer, normalize_epub_href
 
 
 def test_normalize_empty_href():
@@ -171,3 +171,11 @@ def test_normalize_anchor_fragment():
     result = normalize_epub_href(Path("text/chapter1.xhtml"), "chapter2.xhtml#section1")
     # Fragments should be preserved
     assert "chapter2.xhtml#section1" in result
+
+
+def test_href_normalizer_matches_normalize_epub_href():
+    """Test that a bound normalizer agrees with the two-argument form."""
+    document = Path("text/chapter1.xhtml")
+    normalize = href_normalizer(document)
+    for href in ["image.jpg", "../images/cover.jpg", "/css/main.css", "data:x", "", None]:
+        assert normalize(href) == normalize_epub_href(document, href)
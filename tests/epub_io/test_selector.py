@@ -49,47 +49,48 @@ class FakeBook:
         return self._items
 
 
+def _document(index: int, name: str, body: str) -> SimpleNamespace:
+    path = Path("Text") / name
+    return SimpleNamespace(
+        path=path,
+        spine_item=SimpleNamespace(index=index, href=path, linear=True),
+        tree=html.fromstring(f"<html><body>{body}</body></html>"),
+    )
+
+
+# Parsed once at import: skip detection reads only the TOC and paths, never
+# these trees, so every FakeReader can share them.
+_DOCS = (
+    _document(0, "cover.xhtml", "Cover Page"),
+    _document(1, "opening.xhtml", "Opening remarks from the editor."),
+    _document(2, "preface.xhtml", "This is the preface of the book."),
+    _document(3, "chapter1.xhtml", "Acknowledgments and foreword"),
+)
+
+
 class FakeReader:
     def __init__(self, *_args, **_kwargs):
         self.book = FakeBook()
-        self._docs = [
-            SimpleNamespace(
-                path=Path("Text/cover.xhtml"),
-                spine_item=SimpleNamespace(index=0, href=Path("Text/cover.xhtml"), linear=True),
-                tree=html.fromstring("<html><body>Cover Page</body></html>"),
-            ),
-            SimpleNamespace(
-                path=Path("Text/opening.xhtml"),
-                spine_item=SimpleNamespace(index=1, href=Path("Text/opening.xhtml"), linear=True),
-                tree=html.fromstring("<html><body>Opening remarks from the editor.</body></html>"),
-            ),
-            SimpleNamespace(
-                path=Path("Text/preface.xhtml"),
-                spine_item=SimpleNamespace(index=2, href=Path("Text/preface.xhtml"), linear=True),
-                tree=html.fromstring("<html><body>This is the preface of the book.</body></html>"),
-            ),
-            SimpleNamespace(
-                path=Path("Text/chapter1.xhtml"),
-                spine_item=SimpleNamespace(index=3, href=Path("Text/chapter1.xhtml"), linear=True),
-                tree=html.fromstring("<html><body>Acknowledgments and foreword</body></html>"),
-            ),
-        ]
+        self._docs = _DOCS
 
     def iter_documents(self):
         for doc in self._docs:
             yield doc
 
 
+@pytest.fixture(autouse=True)
+def _fake_reader(monkeypatch):
+    monkeypatch.setattr(selector, "EpubReader", FakeReader)
+
+
 @pytest.fixture
 def settings(tmp_path):
     cfg = AppSettings()
     return cfg.model_copy(update={"work_dir": tmp_path})
 
 
-def test_collect_skip_candidates_uses_toc_only(monkeypatch, settings):
+def test_collect_skip_candidates_uses_toc_only(settings):
     """Test that skip detection only uses TOC titles, not filename/content."""
-    monkeypatch.setattr(selector, "EpubReader", FakeReader)
-
     candidates = selector.collect_skip_candidates(Path("dummy.epub"), settings)
 
     # Cover should be detected from TOC title
@@ -100,18 +101,14 @@ def test_collect_skip_candidates_uses_toc_only(monkeypatch, settings):
     assert not any(c.file_path.name == "chapter1.xhtml" for c in candidates)
 
 
-def test_analyze_skip_candidates_reports_unmatched_titles(monkeypatch, settings):
-    monkeypatch.setattr(selector, "EpubReader", FakeReader)
-
+def test_analyze_skip_candidates_reports_unmatched_titles(settings):
     analysis = selector.analyze_skip_candidates(Path("dummy.epub"), settings)
 
     assert "opening remarks" in analysis.toc_unmatched_titles
 
 
-def test_skip_after_logic_triggers_cascade(monkeypatch, settings):
+def test_skip_after_logic_triggers_cascade(settings):
     """Test that cascade skipping activates after back-matter triggers."""
-    monkeypatch.setattr(selector, "EpubReader", FakeReader)
-
     # Enable cascade skipping
     settings = settings.model_copy(update={"skip_after_back_matter": True})
 
@@ -123,10 +120,8 @@ def test_skip_after_logic_triggers_cascade(monkeypatch, settings):
     assert not any(c.source == "cascade" for c in candidates)
 
 
-def test_skip_after_logic_can_be_disabled(monkeypatch, settings):
+def test_skip_after_logic_can_be_disabled(settings):
     """Test that cascade skipping can be disabled via configuration."""
-    monkeypatch.setattr(selector, "EpubReader", FakeReader)
-
     # Disable cascade skipping
     settings = settings.model_copy(update={"skip_after_back_matter": False})
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from unittest.mock import Mock
 
 from epub_io.toc_utils import parse_toc_to_dict
@@ -74,8 +75,8 @@ def test_parse_toc_fragment_removal():
 
     result = parse_toc_to_dict(reader)
 
-    # Multiple fragments for same file should keep last title
-    assert "chapter1.xhtml" in result
+    # Multiple fragments for same file keep the first title
+    assert result["chapter1.xhtml"] == "Section 1"
     assert result["chapter2.xhtml"] == "Chapter 2 Intro"
 
 
@@ -120,6 +121,22 @@ def test_parse_toc_deeply_nested():
     }
 
 
+def test_parse_toc_nesting_beyond_recursion_limit():
+    """Test that nesting deeper than the interpreter's recursion limit parses."""
+    depth = sys.getrecursionlimit() + 100
+    children: list = [MockLink("leaf.xhtml", "Leaf")]
+    for level in range(depth):
+        children = [(MockLink(f"level{level}.xhtml", f"Level {level}"), children)]
+
+    reader = Mock()
+    reader.book.toc = children
+
+    result = parse_toc_to_dict(reader)
+
+    assert len(result) == depth + 1
+    assert result["leaf.xhtml"] == "Leaf"
+
+
 def test_parse_toc_empty_title():
     """Test handling of empty titles."""
     reader = Mock()
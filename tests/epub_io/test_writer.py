@@ -1,4 +1,4 @@
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 
 from ebooklib import epub
 
@@ -20,7 +20,7 @@ def test_write_updated_epub_updates_toc(monkeypatch, tmp_path):
     )
 
     updated_html = {Path("Text/ch1.xhtml"): "<h1 id='t'>Título</h1>".encode()}
-    toc_updates = {PurePosixPath("Text/ch1.xhtml"): {"t": "Título", None: "Título"}}
+    toc_updates = {"Text/ch1.xhtml": {"t": "Título", None: "Título"}}
 
     output_path = tmp_path / "out.epub"
     writer.write_updated_epub(
@@ -74,13 +74,24 @@ def create_test_epub(epub_path: Path) -> None:
         epub.writestr('OEBPS/styles.css', css_content)
 
 
+@pytest.fixture(scope="module")
+def sample_epub(tmp_path_factory):
+    """The EPUB from create_test_epub, built once for the module.
+
+    Extraction only reads it, so tests share one archive and write their
+    output under their own tmp_path.
+    """
+    epub_path = tmp_path_factory.mktemp("epub") / "test.epub"
+    create_test_epub(epub_path)
+    return epub_path
+
+
 class TestExtractEpubStructure:
     """Tests for extract_epub_structure function."""
 
-    def test_extracts_all_files(self, tmp_path):
+    def test_extracts_all_files(self, tmp_path, sample_epub):
         """Test that all files from EPUB are extracted."""
-        epub_path = tmp_path / "test.epub"
-        create_test_epub(epub_path)
+        epub_path = sample_epub
 
         output_dir = tmp_path / "extracted"
         mapping = extract_epub_structure(epub_path, output_dir)
@@ -96,10 +107,9 @@ class TestExtractEpubStructure:
         }
         assert set(mapping.keys()) == expected_files
 
-    def test_preserves_directory_structure(self, tmp_path):
+    def test_preserves_directory_structure(self, tmp_path, sample_epub):
         """Test that directory structure is preserved."""
-        epub_path = tmp_path / "test.epub"
-        create_test_epub(epub_path)
+        epub_path = sample_epub
 
         output_dir = tmp_path / "extracted"
         mapping = extract_epub_structure(epub_path, output_dir, preserve_structure=True)
@@ -114,10 +124,9 @@ class TestExtractEpubStructure:
         assert (output_dir / 'META-INF' / 'container.xml').exists()
         assert (output_dir / 'OEBPS' / 'content.opf').exists()
 
-    def test_file_contents_are_correct(self, tmp_path):
+    def test_file_contents_are_correct(self, tmp_path, sample_epub):
         """Test that extracted files have correct contents."""
-        epub_path = tmp_path / "test.epub"
-        create_test_epub(epub_path)
+        epub_path = sample_epub
 
         output_dir = tmp_path / "extracted"
         mapping = extract_epub_structure(epub_path, output_dir)
@@ -135,10 +144,9 @@ class TestExtractEpubStructure:
         css_content = mapping['OEBPS/styles.css'].read_text()
         assert 'font-family: serif' in css_content
 
-    def test_creates_output_directory_if_missing(self, tmp_path):
+    def test_creates_output_directory_if_missing(self, tmp_path, sample_epub):
         """Test that output directory is created if it doesn't exist."""
-        epub_path = tmp_path / "test.epub"
-        create_test_epub(epub_path)
+        epub_path = sample_epub
 
         output_dir = tmp_path / "deep" / "nested" / "extracted"
         assert not output_dir.exists()
@@ -166,10 +174,9 @@ class TestExtractEpubStructure:
         with pytest.raises(zipfile.BadZipFile):
             extract_epub_structure(epub_path, output_dir)
 
-    def test_flattened_extraction(self, tmp_path):
+    def test_flattened_extraction(self, tmp_path, sample_epub):
         """Test extraction without preserving directory structure."""
-        epub_path = tmp_path / "test.epub"
-        create_test_epub(epub_path)
+        epub_path = sample_epub
 
         output_dir = tmp_path / "extracted"
         mapping = extract_epub_structure(epub_path, output_dir, preserve_structure=False)
@@ -267,10 +274,9 @@ class TestMetadataDiscoveryIsDeterministic:
 class TestGetEpubMetadataFiles:
     """Tests for get_epub_metadata_files function."""
 
-    def test_identifies_key_metadata_files(self, tmp_path):
+    def test_identifies_key_metadata_files(self, tmp_path, sample_epub):
         """Test that key metadata files are correctly identified."""
-        epub_path = tmp_path / "test.epub"
-        create_test_epub(epub_path)
+        epub_path = sample_epub
 
         output_dir = tmp_path / "extracted"
         mapping = extract_epub_structure(epub_path, output_dir)
@@ -338,3 +344,22 @@ def test_nothing_is_written_when_a_later_member_is_unsafe(tmp_path):
     written = list(output_dir.rglob("*")) if output_dir.exists() else []
     assert written == []
     assert not (tmp_path / "escape.txt").exists()
+
+
+def test_parallel_extraction_writes_every_member(tmp_path, monkeypatch):
+    """Members copied across several workers all land intact and in the mapping."""
+    from extraction import epub_export
+
+    monkeypatch.setattr(epub_export.os, "cpu_count", lambda: 4)
+
+    epub_path = tmp_path / "many.epub"
+    with zipfile.ZipFile(epub_path, "w", zipfile.ZIP_DEFLATED) as epub:
+        for index in range(25):
+            epub.writestr(f"OEBPS/Text/part{index:02d}.xhtml", f"<p>{index}</p>" * 100)
+
+    mapping = extract_epub_structure(epub_path, tmp_path / "extracted")
+
+    assert list(mapping) == [f"OEBPS/Text/part{index:02d}.xhtml" for index in range(25)]
+    for index in range(25):
+        path = mapping[f"OEBPS/Text/part{index:02d}.xhtml"]
+        assert path.read_text() == f"<p>{index}</p>" * 100
@@ -1,10 +1,14 @@
 from collections import defaultdict
-from pathlib import Path, PurePosixPath
+from pathlib import Path
 from types import SimpleNamespace
 
 from lxml import html
 
-from injection.engine import _apply_translations_to_document, _group_translated_segments
+from injection.engine import (
+    _apply_translations_to_document,
+    _group_translated_segments,
+    _segment_locator,
+)
 from state.models import ExtractMode, Segment, SegmentMetadata, SegmentStatus, TranslationRecord
 
 
@@ -60,7 +64,7 @@ def test_apply_translations_replaces_in_translated_only_mode():
     headings = tree.xpath("/html/body/h1")
     assert len(headings) == 1
     assert headings[0].text == "Título traducido"
-    mapped = title_map[PurePosixPath("Text/ch1.xhtml")]
+    mapped = title_map["Text/ch1.xhtml"]
     assert mapped["t"] == "Título traducido"
     assert mapped[None] == "Título traducido"
 
@@ -211,3 +215,20 @@ def test_apply_translations_ul_no_wrapper():
 
     assert "<wrapper>" not in result
     assert "<li>项目 1</li>" in result
+
+
+def test_segment_locator_matches_xpath_for_getpath_results():
+    markup = (
+        "<html><body><h1>Title</h1><p>a</p><div><p>b</p></div><p>c</p>"
+        "<ul><li>x</li><li>y</li></ul></body></html>"
+    )
+    tree = html.fromstring(markup)
+    root_tree = tree.getroottree()
+    locate = _segment_locator(root_tree)
+
+    for element in tree.iter():
+        assert locate(root_tree.getpath(element)) == [element]
+    # Not a plain positional path: answered by the xpath engine instead.
+    assert locate("/html/body/p[last()]") == root_tree.xpath("/html/body/p[last()]")
+    assert locate("/html/body/p[9]") == []
+
@@ -8,8 +8,10 @@ from pathlib import Path
 import pytest
 from pydantic import BaseModel
 
+from state import base
 from state.base import (
     atomic_write,
+    batched_updates,
     load_generic_state,
     save_generic_state,
     update_state_item,
@@ -287,6 +289,46 @@ class TestUpdateStateItem:
         assert final_state.counter == 3
 
 
+class TestBatchedUpdates:
+    """Tests for batched_updates context manager."""
+
+    def test_batch_writes_once(self, tmp_path: Path, monkeypatch):
+        """Several in-place edits reach disk in a single write."""
+        state_file = tmp_path / "state.json"
+        save_generic_state(SimpleState(counter=0), state_file)
+
+        writes: list[Path] = []
+        real_write = base._atomic_write_text
+
+        def counting_write(path: Path, content: str) -> None:
+            writes.append(path)
+            real_write(path, content)
+
+        monkeypatch.setattr(base, "_atomic_write_text", counting_write)
+
+        with batched_updates(state_file, SimpleState) as state:
+            for _ in range(3):
+                state.counter += 1
+            state.name = "batched"
+
+        assert writes == [state_file]
+        final_state = load_generic_state(state_file, SimpleState)
+        assert final_state.counter == 3
+        assert final_state.name == "batched"
+
+    def test_batch_discarded_on_error(self, tmp_path: Path):
+        """An exception inside the block leaves the file untouched."""
+        state_file = tmp_path / "state.json"
+        save_generic_state(SimpleState(counter=1), state_file)
+
+        with pytest.raises(RuntimeError):
+            with batched_updates(state_file, SimpleState) as state:
+                state.counter = 99
+                raise RuntimeError("boom")
+
+        assert load_generic_state(state_file, SimpleState).counter == 1
+
+
 class TestIntegration:
     """Integration tests combining multiple functions."""
 
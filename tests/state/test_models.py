@@ -0,0 +1,46 @@
+"""Tests for state document models."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from state.models import Segment, SegmentsDocument
+
+
+def _segment_payload(segment_id: str, file_path: str) -> dict:
+    return {
+        "segment_id": segment_id,
+        "file_path": file_path,
+        "xpath": "/html/body/p",
+        "extract_mode": "text",
+        "source_content": "text",
+        "metadata": {"element_type": "p", "spine_index": 0, "order_in_file": 1},
+    }
+
+
+def test_segments_in_one_document_share_a_path():
+    document = SegmentsDocument.model_validate(
+        {
+            "epub_path": "book.epub",
+            "generated_at": "2024-01-01T00:00:00",
+            "segments": [
+                _segment_payload("a", "Text/ch1.xhtml"),
+                _segment_payload("b", "Text/ch1.xhtml"),
+            ],
+        }
+    )
+
+    first, second = document.segments
+    assert first.file_path == Path("Text/ch1.xhtml")
+    assert first.file_path is second.file_path
+
+    reloaded = SegmentsDocument.model_validate_json(document.model_dump_json())
+    assert reloaded.segments[0].file_path == Path("Text/ch1.xhtml")
+
+
+def test_segment_file_path_rejects_non_paths():
+    with pytest.raises(ValidationError):
+        Segment.model_validate(_segment_payload("a", 3))
@@ -0,0 +1,55 @@
+"""Tests for translation state store helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from state.models import SegmentStatus, StateDocument, TranslationRecord
+from state.store import load_state, mark_completed, mark_failed, save_state
+
+
+@pytest.fixture
+def state_file(tmp_path: Path) -> Path:
+    path = tmp_path / "state.json"
+    save_state(
+        StateDocument(
+            segments={
+                "a": TranslationRecord(segment_id="a", status=SegmentStatus.PENDING),
+                "b": TranslationRecord(segment_id="b", status=SegmentStatus.PENDING),
+            },
+        ),
+        path,
+    )
+    return path
+
+
+def test_mark_failed_counts_consecutive_failures(state_file: Path):
+    assert mark_failed(state_file, "a", "timeout") == 1
+    assert mark_failed(state_file, "b", "timeout") == 2
+
+    state = load_state(state_file)
+    assert state.segments["a"].status == SegmentStatus.ERROR
+    assert state.segments["a"].error_message == "timeout"
+    assert state.consecutive_failures == 2
+
+
+def test_mark_completed_resets_consecutive_failures(state_file: Path):
+    mark_failed(state_file, "a", "timeout")
+
+    record = mark_completed(state_file, "b", translation="Hola", error_message=None)
+
+    assert record.status == SegmentStatus.COMPLETED
+    state = load_state(state_file)
+    assert state.segments["b"].translation == "Hola"
+    assert state.consecutive_failures == 0
+
+
+def test_mark_completed_unknown_segment_leaves_file_untouched(state_file: Path):
+    before = state_file.read_bytes()
+
+    with pytest.raises(KeyError):
+        mark_completed(state_file, "missing", translation="x")
+
+    assert state_file.read_bytes() == before
@@ -20,21 +20,31 @@ class DummyProvider:
 
 @pytest.fixture
 def settings(tmp_path):
-    cfg = AppSettings().model_copy(update={"work_dir": tmp_path})
-    cfg.ensure_directories()
-    return cfg
+    # work_dir is tmp_path itself, which already exists, so there is nothing for
+    # ensure_directories() to create.
+    return AppSettings().model_copy(update={"work_dir": tmp_path})
 
 
-def _write_segments(settings: AppSettings, input_epub: Path) -> Segment:
-    segment = Segment(
-        segment_id="chapter1-001",
-        file_path=Path("Text/chapter1.xhtml"),
-        xpath="/html/body/p[1]",
+_CHAPTER_PATH = Path("Text/chapter1.xhtml")
+
+
+def _fast_segment(segment_id: str, xpath: str, content: str, order_in_file: int) -> Segment:
+    # Inputs are test-controlled, so skip validation.
+    return Segment.model_construct(
+        segment_id=segment_id,
+        file_path=_CHAPTER_PATH,
+        xpath=xpath,
         extract_mode=ExtractMode.TEXT,
-        source_content="Hello world",
-        metadata=SegmentMetadata(element_type="p", spine_index=0, order_in_file=1),
+        source_content=content,
+        metadata=SegmentMetadata.model_construct(
+            element_type="p", spine_index=0, order_in_file=order_in_file
+        ),
     )
-    document = SegmentsDocument(
+
+
+def _write_segments(settings: AppSettings, input_epub: Path) -> Segment:
+    segment = _fast_segment("chapter1-001", "/html/body/p[1]", "Hello world", 1)
+    document = SegmentsDocument.model_construct(
         epub_path=input_epub,
         generated_at="2024-01-01T00:00:00Z",
         segments=[segment],
@@ -124,24 +134,10 @@ def test_run_translation_auto_copies_punctuation(monkeypatch, settings, tmp_path
     input_epub = tmp_path / "auto-copy.epub"
     input_epub.write_text("stub", encoding="utf-8")
 
-    ellipsis_segment = Segment(
-        segment_id="seg-ellipsis",
-        file_path=Path("Text/chapter1.xhtml"),
-        xpath="/html/body/p[1]",
-        extract_mode=ExtractMode.TEXT,
-        source_content="…",
-        metadata=SegmentMetadata(element_type="p", spine_index=0, order_in_file=1),
-    )
-    content_segment = Segment(
-        segment_id="seg-content",
-        file_path=Path("Text/chapter1.xhtml"),
-        xpath="/html/body/p[2]",
-        extract_mode=ExtractMode.TEXT,
-        source_content="Hello world",
-        metadata=SegmentMetadata(element_type="p", spine_index=0, order_in_file=2),
-    )
+    ellipsis_segment = _fast_segment("seg-ellipsis", "/html/body/p[1]", "…", 1)
+    content_segment = _fast_segment("seg-content", "/html/body/p[2]", "Hello world", 2)
 
-    document = SegmentsDocument(
+    document = SegmentsDocument.model_construct(
         epub_path=input_epub,
         generated_at="2024-01-01T00:00:00Z",
         segments=[ellipsis_segment, content_segment],
@@ -27,26 +27,32 @@ class DummyParallelProvider:
 
 @pytest.fixture
 def settings(tmp_path):
-    cfg = AppSettings().model_copy(update={"work_dir": tmp_path})
-    cfg.ensure_directories()
-    return cfg
+    # work_dir is tmp_path itself, which already exists, so there is nothing for
+    # ensure_directories() to create.
+    return AppSettings().model_copy(update={"work_dir": tmp_path})
+
+
+_CHAPTER_PATH = Path("Text/chapter1.xhtml")
 
 
 def _write_segments(settings: AppSettings, input_epub: Path, count: int = 5) -> list[Segment]:
     """Create test segments."""
-    segments = []
-    for i in range(count):
-        segment = Segment(
+    # Inputs are test-controlled, so skip validation.
+    segments = [
+        Segment.model_construct(
             segment_id=f"seg-{i:03d}",
-            file_path=Path("Text/chapter1.xhtml"),
+            file_path=_CHAPTER_PATH,
             xpath=f"/html/body/p[{i+1}]",
             extract_mode=ExtractMode.TEXT,
             source_content=f"Text segment {i}",
-            metadata=SegmentMetadata(element_type="p", spine_index=0, order_in_file=i + 1),
+            metadata=SegmentMetadata.model_construct(
+                element_type="p", spine_index=0, order_in_file=i + 1
+            ),
         )
-        segments.append(segment)
+        for i in range(count)
+    ]
 
-    document = SegmentsDocument(
+    document = SegmentsDocument.model_construct(
         epub_path=input_epub,
         generated_at="2024-01-01T00:00:00Z",
         segments=segments,
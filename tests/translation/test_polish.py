@@ -1,4 +1,12 @@
-from translation.polish import polish_translation, target_is_chinese
+from state.models import SegmentStatus, StateDocument, TranslationRecord
+from state.store import load_state, save_state
+from translation import polish
+from translation.polish import (
+    polish_if_chinese,
+    polish_state,
+    polish_translation,
+    target_is_chinese,
+)
 
 
 def test_polish_inserts_spaces_between_chinese_and_numbers():
@@ -100,3 +108,58 @@ def test_polish_handles_mixed_ellipsis_and_chinese_rules():
     assert polish_translation("学习 . . . machine learning") == "学习... machine learning"
     # Ellipsis + dash formatting
     assert polish_translation("文字 . . . 中文--英文") == "文字... 中文 —— 英文"
+
+
+def test_polish_state_polishes_each_distinct_translation_once(monkeypatch):
+    calls = []
+
+    def _counting_polish(text, config=None):
+        calls.append(text)
+        return text
+
+    monkeypatch.setattr(polish, "polish_translation", _counting_polish)
+    state = StateDocument(
+        segments={
+            seg_id: TranslationRecord(
+                segment_id=seg_id, status=SegmentStatus.COMPLETED, translation="第一章"
+            )
+            for seg_id in ("a", "b")
+        }
+    )
+
+    polish_state(state)
+
+    assert calls == ["第一章"]
+
+
+def test_polish_if_chinese_reuses_first_pass_results(monkeypatch, tmp_path):
+    calls = []
+
+    def _counting_polish(text, config=None):
+        calls.append(text)
+        return f"{text}!"
+
+    monkeypatch.setattr(polish, "polish_translation", _counting_polish)
+    state_path = tmp_path / "state.json"
+    save_state(
+        StateDocument(
+            segments={
+                "a": TranslationRecord(
+                    segment_id="a", status=SegmentStatus.COMPLETED, translation="第一章"
+                )
+            }
+        ),
+        state_path,
+    )
+
+    changed = polish_if_chinese(
+        state_path,
+        "Simplified Chinese",
+        load_fn=load_state,
+        save_fn=save_state,
+        console_print=lambda *_: None,
+    )
+
+    assert changed
+    assert calls == ["第一章"]
+    assert load_state(state_path).segments["a"].translation == "第一章!"
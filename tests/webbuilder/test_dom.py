@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from webbuilder import dom
 from webbuilder.dom import clean_html
 
 
@@ -41,3 +43,22 @@ def test_clean_html_rewrites_media_urls(tmp_path):
     )
     assert 'href="content/chapters/images/cover.jpg"' in cleaned
     assert 'href="content/chapter2.xhtml#section"' in cleaned
+
+
+def test_clean_html_rewrites_srcset_candidates_in_place():
+    html_doc = (
+        "<html><body><img srcset='data:image/png;base64,AA,BB 1x, img/b.png 2x,"
+        "../c.png 3x' /></body></html>"
+    )
+    cleaned = clean_html(html_doc, relative_path=Path("text/ch1.xhtml"))
+    assert (
+        'srcset="data:image/png;base64,AA,BB 1x, content/text/img/b.png 2x,content/c.png 3x"'
+        in cleaned
+    )
+
+
+def test_each_thread_gets_its_own_parser():
+    with ThreadPoolExecutor(2) as executor:
+        parsers = list(executor.map(lambda _: dom._parser(), range(2)))
+    assert dom._parser() is dom._parser()
+    assert all(parser is not dom._parser() for parser in parsers)